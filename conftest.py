@@ -3,6 +3,8 @@
 This file configures pytest options and hooks for E2E tests.
 """
 
+import pytest
+
 
 def pytest_addoption(parser):
     """Add custom command line options."""
@@ -24,10 +26,10 @@ def pytest_configure(config):
 
 def pytest_collection_modifyitems(config, items):
     """Modify E2E test collection to skip by default."""
-    import pytest
+    if config.getoption("--run-e2e", default=False):
+        return
 
-    if not config.getoption("--run-e2e", default=False):
-        skip_e2e = pytest.mark.skip(reason="E2E tests require --run-e2e flag")
-        for item in items:
-            if "e2e" in item.keywords:
-                item.add_marker(skip_e2e)
+    skip_e2e = pytest.mark.skip(reason="E2E tests require --run-e2e flag")
+    for item in items:
+        if "e2e" in item.keywords:
+            item.add_marker(skip_e2e)
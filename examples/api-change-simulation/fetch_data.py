@@ -6,7 +6,18 @@ This script was written for version 1.0 of the API module and breaks with versio
 because the function signature changed.
 """
 
-import json
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+    import json
+
+    def format_json(data):
+        """Pretty-print data as JSON with two-space indentation."""
+        return json.dumps(data, indent=2)
+else:
+    def format_json(data):
+        """Pretty-print data as JSON with two-space indentation."""
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
 
 from api_module import get_user_data, list_users
 
@@ -27,7 +38,7 @@ def display_user(user_id):
     # Try to access metadata if it exists
     if 'metadata' in user:
         print("\nMetadata:")
-        print(json.dumps(user['metadata'], indent=2))
+        print(format_json(user['metadata']))
 
 
 def main():
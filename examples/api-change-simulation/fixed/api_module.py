@@ -8,6 +8,8 @@ Version 2.0 introduced breaking changes:
 This is the same as the broken version - the API itself doesn't need fixing.
 """
 
+from functools import lru_cache
+
 
 def get_user_data(user_id, include_metadata=False):
     """
@@ -23,24 +25,48 @@ def get_user_data(user_id, include_metadata=False):
     Note: Version 2.0 - This parameter is now required!
     Previously this function only took user_id as a parameter.
     """
+    # Callers get a fresh dict so they can mutate it without touching the cache
+    user_data = dict(_fetch_user_data(user_id, include_metadata))
+    if include_metadata:
+        user_data['metadata'] = dict(user_data['metadata'])
+    return user_data
+
+
+@lru_cache(maxsize=4096)
+def _fetch_user_data(user_id, include_metadata):
+    """Build the simulated API response once per (user_id, include_metadata)."""
     # Simulate API response
-    user_data = {
-        'id': user_id,
-        'name': f'User {user_id}',
-        'email': f'user{user_id}@example.com',
-        'status': 'active'
-    }
+    user_data = (
+        ('id', user_id),
+        ('name', f'User {user_id}'),
+        ('email', f'user{user_id}@example.com'),
+        ('status', 'active'),
+    )
 
     if include_metadata:
-        user_data['metadata'] = {
+        user_data += (('metadata', {
             'created_at': '2024-01-01',
             'last_login': '2024-12-15',
             'account_type': 'premium'
-        }
+        }),)
 
     return user_data
 
 
+def iter_users(limit=10):
+    """
+    Lazily iterate over users, fetching one at a time.
+
+    Args:
+        limit (int): Maximum number of users to yield
+
+    Yields:
+        dict: User data dictionaries
+    """
+    for i in range(1, limit + 1):
+        yield get_user_data(i, include_metadata=False)
+
+
 def list_users(limit=10):
     """
     List all users with pagination.
@@ -51,4 +77,4 @@ def list_users(limit=10):
     Returns:
         list: List of user dictionaries
     """
-    return [get_user_data(i, include_metadata=False) for i in range(1, limit + 1)]
+    return list(iter_users(limit))
@@ -5,7 +5,18 @@ Data Fetcher Script - Uses the API module to fetch and display user data.
 This is the FIXED version that properly uses API v2.0 with the new signature.
 """
 
-import json
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+    import json
+
+    def format_json(data):
+        """Pretty-print data as JSON with two-space indentation."""
+        return json.dumps(data, indent=2)
+else:
+    def format_json(data):
+        """Pretty-print data as JSON with two-space indentation."""
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
 
 from api_module import get_user_data, list_users
 
@@ -26,7 +37,7 @@ def display_user(user_id):
     # Try to access metadata if it exists
     if 'metadata' in user:
         print("\nMetadata:")
-        print(json.dumps(user['metadata'], indent=2))
+        print(format_json(user['metadata']))
 
 
 def main():
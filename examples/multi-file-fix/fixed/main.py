@@ -6,8 +6,19 @@ This script uses helper functions from the utils package.
 This is the FIXED version - the bugs are fixed in the utils/helpers.py file.
 """
 
+from types import MappingProxyType
+
 from utils import calculate_average, calculate_total, format_currency
 
+# Sample sales data, built once at import time and shared read-only
+SAMPLE_SALES = (
+    MappingProxyType({'id': 1, 'product': 'Widget A', 'amount': 150.00}),
+    MappingProxyType({'id': 2, 'product': 'Widget B', 'amount': 75.50}),
+    MappingProxyType({'id': 3, 'product': 'Widget A', 'amount': 200.00}),
+    MappingProxyType({'id': 4, 'product': 'Widget C', 'amount': 125.75}),
+    MappingProxyType({'id': 5, 'product': 'Widget B', 'amount': 90.00}),
+)
+
 
 def generate_sales_report(sales_data):
     """Generate a comprehensive sales report."""
@@ -29,34 +40,22 @@ def generate_sales_report(sales_data):
 
     # Show breakdown by product
     print("\nSales by Product:")
+    # Single pass: accumulate running total and count per product
     products = {}
     for sale in sales_data:
-        product = sale['product']
-        if product not in products:
-            products[product] = []
-        products[product].append(sale['amount'])
-
-    for product, amounts in products.items():
-        product_total = sum(amounts)
-        product_avg = calculate_average(amounts)
+        product_total, count = products.get(sale['product'], (0.0, 0))
+        products[sale['product']] = (product_total + sale['amount'], count + 1)
+
+    for product, (product_total, count) in products.items():
         print(f"  {product}:")
         print(f"    Total: {format_currency(product_total)}")
-        print(f"    Average: {format_currency(product_avg)}")
-        print(f"    Count: {len(amounts)}")
+        print(f"    Average: {format_currency(product_total / count)}")
+        print(f"    Count: {count}")
 
 
 def main():
-    # Sample sales data
-    sales_data = [
-        {'id': 1, 'product': 'Widget A', 'amount': 150.00},
-        {'id': 2, 'product': 'Widget B', 'amount': 75.50},
-        {'id': 3, 'product': 'Widget A', 'amount': 200.00},
-        {'id': 4, 'product': 'Widget C', 'amount': 125.75},
-        {'id': 5, 'product': 'Widget B', 'amount': 90.00},
-    ]
-
     print("Sales Report Generator v1.0\n")
-    generate_sales_report(sales_data)
+    generate_sales_report(SAMPLE_SALES)
 
     # This will now work - empty list is handled gracefully
     print("\n" + "=" * 50)
@@ -4,6 +4,10 @@ Helper functions for data processing and formatting.
 This is the FIXED version with both bugs corrected.
 """
 
+from collections.abc import Sequence
+from operator import itemgetter
+from statistics import fmean
+
 
 def calculate_average(numbers):
     """
@@ -19,8 +23,8 @@ def calculate_average(numbers):
     """
     if not numbers:  # Fixed: Check for empty list
         return 0.0
-    total = sum(numbers)
-    return total / len(numbers)
+    # fmean sums in C in a single pass instead of sum() followed by len()
+    return fmean(numbers)
 
 
 def format_currency(amount):
@@ -49,4 +53,12 @@ def calculate_total(items, key='amount'):
     Returns:
         float: Total sum
     """
-    return sum(item.get(key, 0) for item in items)
+    if not isinstance(items, Sequence):
+        # The fallback below iterates again, so a one-shot iterable such as
+        # a generator has to be materialized first
+        items = list(items)
+    try:
+        # Fast path: every item has the key, so sum() can consume map() in C
+        return sum(map(itemgetter(key), items))
+    except KeyError:
+        return sum(item.get(key, 0) for item in items)
@@ -23,6 +23,10 @@ from lazarus.core.context import ExecutionResult
 from lazarus.core.healer import HealingResult
 from lazarus.notifications import NotificationDispatcher
 
+SEPARATOR = "=" * 60
+SUCCESS_ICON = "✅"
+FAILURE_ICON = "❌"
+
 
 def create_sample_healing_result(success: bool = False) -> HealingResult:
     """Create a sample healing result for demonstration.
@@ -77,7 +81,7 @@ def example_slack_only():
     notification_results = dispatcher.dispatch(result, script_path)
 
     for nr in notification_results:
-        print(f"  {nr.channel_name}: {'✅' if nr.success else '❌'}")
+        print(f"  {nr.channel_name}: {SUCCESS_ICON if nr.success else FAILURE_ICON}")
 
 
 def example_multi_channel():
@@ -144,7 +148,7 @@ def example_multi_channel():
 
     print("\nResults:")
     for nr in notification_results:
-        status = "✅ Success" if nr.success else f"❌ Failed: {nr.error_message}"
+        status = f"{SUCCESS_ICON} Success" if nr.success else f"{FAILURE_ICON} Failed: {nr.error_message}"
         print(f"  {nr.channel_name}: {status}")
 
 
@@ -165,8 +169,8 @@ def example_custom_channel():
 
         def send(self, result: HealingResult, script_path: Path) -> bool:
             """Print notification to console."""
-            status = "✅ SUCCESS" if result.success else "❌ FAILED"
-            print(f"\n{'='*60}")
+            status = f"{SUCCESS_ICON} SUCCESS" if result.success else f"{FAILURE_ICON} FAILED"
+            print(f"\n{SEPARATOR}")
             print(f"NOTIFICATION: {status}")
             print(f"Script: {script_path}")
             print(f"Attempts: {len(result.attempts)}")
@@ -175,7 +179,7 @@ def example_custom_channel():
                 print(f"Error: {result.error_message}")
             if result.pr_url:
                 print(f"PR: {result.pr_url}")
-            print(f"{'='*60}\n")
+            print(f"{SEPARATOR}\n")
             return True
 
     # Start with basic config
@@ -218,22 +222,22 @@ def example_success_vs_failure():
     # Test with successful healing
     print("\n1. Successful healing:")
     success_result = create_sample_healing_result(success=True)
-    results = dispatcher.dispatch(success_result, script_path)
-    print(f"  Slack sent: {any(r.channel_name == 'slack' and r.success for r in results)}")
-    print(f"  Discord sent: {any(r.channel_name == 'discord' and r.success for r in results)}")
+    sent = {r.channel_name for r in dispatcher.dispatch(success_result, script_path) if r.success}
+    print(f"  Slack sent: {'slack' in sent}")
+    print(f"  Discord sent: {'discord' in sent}")
 
     # Test with failed healing
     print("\n2. Failed healing:")
     failure_result = create_sample_healing_result(success=False)
-    results = dispatcher.dispatch(failure_result, script_path)
-    print(f"  Slack sent: {any(r.channel_name == 'slack' and r.success for r in results)}")
-    print(f"  Discord sent: {any(r.channel_name == 'discord' and r.success for r in results)}")
+    sent = {r.channel_name for r in dispatcher.dispatch(failure_result, script_path) if r.success}
+    print(f"  Slack sent: {'slack' in sent}")
+    print(f"  Discord sent: {'discord' in sent}")
 
 
 def main():
     """Run all examples."""
     print("Lazarus Notification System Examples")
-    print("=" * 60)
+    print(SEPARATOR)
 
     # Note: Most examples won't actually send notifications unless you
     # configure real webhook URLs via environment variables
@@ -250,7 +254,7 @@ def main():
     # Example 4: Success vs failure
     # example_success_vs_failure()
 
-    print("\n" + "=" * 60)
+    print("\n" + SEPARATOR)
     print("Examples completed!")
     print("\nTo actually send notifications, set these environment variables:")
     print("  - SLACK_WEBHOOK_URL")
@@ -7,43 +7,51 @@ This is the FIXED version with the syntax error corrected.
 
 import json
 from datetime import datetime
+from types import MappingProxyType
+
+# Sample sales data, built once at import time and shared read-only
+SAMPLE_SALES = (
+    MappingProxyType({'id': 1, 'amount': 150.00, 'product': 'Widget A'}),
+    MappingProxyType({'id': 2, 'amount': 75.50, 'product': 'Widget B'}),
+    MappingProxyType({'id': 3, 'amount': 200.00, 'product': 'Widget C'}),
+    MappingProxyType({'id': 4, 'amount': 125.75, 'product': 'Widget A'}),
+    MappingProxyType({'id': 5, 'amount': 90.00, 'product': 'Widget D'}),
+)
 
 
 def calculate_total_sales(sales_data):  # Fixed: Added missing colon
     """Calculate the total sales from the data."""
+    return summarize_sales(sales_data)[0]
+
+
+def summarize_sales(sales_data):
+    """Compute the total and transaction count in a single pass."""
     total = 0
+    count = 0
     for sale in sales_data:
         total += sale.get('amount', 0)
-    return total
+        count += 1
+    return total, count
 
 
 def generate_report(sales_data):
     """Generate a sales report."""
-    total = calculate_total_sales(sales_data)
-    average = total / len(sales_data) if sales_data else 0
+    total, count = summarize_sales(sales_data)
+    average = total / count if count else 0
 
     report = {
         'timestamp': datetime.now().isoformat(),
         'total_sales': total,
         'average_sale': average,
-        'num_transactions': len(sales_data)
+        'num_transactions': count
     }
 
     return report
 
 
 def main():
-    # Sample sales data
-    sales_data = [
-        {'id': 1, 'amount': 150.00, 'product': 'Widget A'},
-        {'id': 2, 'amount': 75.50, 'product': 'Widget B'},
-        {'id': 3, 'amount': 200.00, 'product': 'Widget C'},
-        {'id': 4, 'amount': 125.75, 'product': 'Widget A'},
-        {'id': 5, 'amount': 90.00, 'product': 'Widget D'},
-    ]
-
     print("Processing sales data...")
-    report = generate_report(sales_data)
+    report = generate_report(SAMPLE_SALES)
 
     print("\n=== Sales Report ===")
     print(json.dumps(report, indent=2))
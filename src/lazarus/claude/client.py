@@ -6,14 +6,32 @@ enabling automated healing of failed scripts through subprocess calls.
 
 from __future__ import annotations
 
+import asyncio
+import dataclasses
+import json
+import os
 import re
 import shutil
+import stat
 import subprocess
+from collections.abc import Sequence
 from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
 from lazarus.claude.parser import ClaudeResponse, parse_claude_output
 from lazarus.claude.prompts import build_diagnosis_prompt, build_healing_prompt
-from lazarus.core.context import HealingContext
+
+if TYPE_CHECKING:
+    from lazarus.config.schema import HealingConfig
+    from lazarus.core.context import HealingContext
+
+# Emit one JSON event per line so tool calls can be parsed exactly; print
+# mode requires --verbose for stream-json
+_STRUCTURED_OUTPUT_ARGS = ("--output-format", "stream-json", "--verbose")
+
+# Each task's report in a batched reply opens with its delimiter line
+_TASK_DELIMITER = "--- TASK {} ---"
+_TASK_DELIMITER_RE = re.compile(r"^--- TASK (\d+) ---[ \t]*$", re.MULTILINE)
 
 
 class ClaudeCodeClient:
@@ -38,13 +56,36 @@ class ClaudeCodeClient:
         Raises:
             ValueError: If working_dir does not exist or is not a directory
         """
-        if not working_dir.exists():
-            raise ValueError(f"Working directory does not exist: {working_dir}")
-        if not working_dir.is_dir():
+        # A single stat() answers both "exists" and "is a directory"
+        try:
+            mode = working_dir.stat().st_mode
+        except OSError:
+            raise ValueError(f"Working directory does not exist: {working_dir}") from None
+        if not stat.S_ISDIR(mode):
             raise ValueError(f"Working directory is not a directory: {working_dir}")
 
         self.working_dir = working_dir.resolve()
         self.timeout = timeout
+        # (PATH value, resolved claude executable) from the last lookup
+        self._which_cache: tuple[str, str | None] | None = None
+        self._version: str | None = None
+        # (healing config, joined --allowedTools value) for the last request
+        self._allowed_tools_cache: tuple[HealingConfig, str] | None = None
+
+    def _find_claude(self) -> str | None:
+        """Resolve the claude executable, re-searching only when PATH changes.
+
+        Returns:
+            Absolute path to the claude executable, or None if not found
+        """
+        path_env = os.environ.get("PATH", "")
+        if self._which_cache is None or self._which_cache[0] != path_env:
+            self._which_cache = (path_env, shutil.which("claude"))
+        return self._which_cache[1]
+
+    def _claude_executable(self) -> str:
+        """Get the command used to launch claude, preferring the resolved path."""
+        return self._find_claude() or "claude"
 
     def is_available(self) -> bool:
         """Check if the claude CLI command is available.
@@ -52,21 +93,27 @@ class ClaudeCodeClient:
         Returns:
             True if claude CLI is installed and accessible, False otherwise
         """
-        return shutil.which("claude") is not None
+        return self._find_claude() is not None
 
     def get_version(self) -> str | None:
         """Get the version of the installed Claude Code CLI.
 
+        The first successful result is cached for the lifetime of the client,
+        so only one ``claude --version`` process is spawned.
+
         Returns:
             Version string if available, None if claude is not installed or
             version cannot be determined
         """
+        if self._version is not None:
+            return self._version
+
         if not self.is_available():
             return None
 
         try:
             result = subprocess.run(
-                ["claude", "--version"],
+                [self._claude_executable(), "--version"],
                 capture_output=True,
                 text=True,
                 timeout=5,
@@ -78,9 +125,8 @@ class ClaudeCodeClient:
                 version_line = result.stdout.strip()
                 # Extract version number (major.minor.patch format)
                 match = re.search(r'(\d+\.\d+\.\d+)', version_line)
-                if match:
-                    return match.group(1)
-                return version_line
+                self._version = match.group(1) if match else version_line
+                return self._version
 
             return None
 
@@ -106,35 +152,114 @@ class ClaudeCodeClient:
             RuntimeError: If Claude CLI is not available
             subprocess.TimeoutExpired: If the command exceeds the timeout
         """
-        if not self.is_available():
-            raise RuntimeError(
-                "Claude Code CLI is not available. Please install it first:\n"
-                "  npm install -g @anthropic-ai/claude-code\n"
-                "Then authenticate with:\n"
-                "  claude login"
-            )
+        return self._execute(self._build_fix_command(context))
+
+    async def request_fix_async(self, context: HealingContext) -> ClaudeResponse:
+        """Request Claude Code to fix a failed script without blocking the event loop.
+
+        Behaves like request_fix, but awaits the Claude Code process, so
+        other work (for example a diagnosis request) can run concurrently.
+
+        Args:
+            context: Complete healing context with error information
+
+        Returns:
+            ClaudeResponse with the results of the healing attempt
+
+        Raises:
+            RuntimeError: If Claude CLI is not available
+        """
+        return await self._execute_async(self._build_fix_command(context))
+
+    def _build_fix_command(self, context: HealingContext) -> list[str]:
+        """Build the Claude Code command line for a fix request.
+
+        Args:
+            context: Complete healing context with error information
+
+        Returns:
+            Command line to execute
+
+        Raises:
+            RuntimeError: If Claude CLI is not available
+        """
+        self._ensure_available()
 
         # Build the healing prompt
         prompt = build_healing_prompt(context)
 
         # Determine allowed tools based on config
-        allowed_tools = self._get_allowed_tools(context)
+        allowed_tools = self._allowed_tools_arg(context)
 
         # Build the command
         # Use -p flag for prompt-only mode (non-interactive)
         command = [
-            "claude",
+            self._claude_executable(),
             "-p",
             prompt,
+            *_STRUCTURED_OUTPUT_ARGS,
         ]
 
         # Add allowed tools constraint if specified
         if allowed_tools:
-            command.extend(["--allowedTools", ",".join(allowed_tools)])
+            command.extend(["--allowedTools", allowed_tools])
+
+        return command
 
+    def _ensure_available(self) -> None:
+        """Raise if the claude CLI cannot be found.
+
+        Raises:
+            RuntimeError: If Claude CLI is not available
+        """
+        if not self.is_available():
+            raise RuntimeError(
+                "Claude Code CLI is not available. Please install it first:\n"
+                "  npm install -g @anthropic-ai/claude-code\n"
+                "Then authenticate with:\n"
+                "  claude login"
+            )
+
+    def _execute(self, command: list[str]) -> ClaudeResponse:
+        """Run a Claude Code command and parse its output.
+
+        Args:
+            command: Full command line, starting with the claude executable
+
+        Returns:
+            ClaudeResponse parsed from the command output, or a failed
+            response describing a timeout or launch error
+        """
+        result = self._run(command)
+        if isinstance(result, ClaudeResponse):
+            return result
+
+        return parse_claude_output(
+            stdout=result.stdout,
+            stderr=result.stderr,
+            exit_code=result.returncode,
+        )
+
+    def _run(
+        self, command: list[str]
+    ) -> subprocess.CompletedProcess[str] | ClaudeResponse:
+        """Run a Claude Code command and capture its output.
+
+        No preexec_fn, user/group switch or umask is passed, which lets
+        CPython spawn the process with vfork() on Linux instead of a full
+        fork() of the healer's address space. Keep it that way when adding
+        arguments here.
+
+        Args:
+            command: Full command line, starting with the claude executable
+
+        Returns:
+            Completed process, or a failed ClaudeResponse describing a
+            timeout or launch error
+        """
         try:
             # Execute Claude Code
-            result = subprocess.run(
+            return subprocess.run(
                 command,
                 cwd=self.working_dir,
                 capture_output=True,
@@ -142,38 +267,48 @@ class ClaudeCodeClient:
                 timeout=self.timeout,
             )
 
-            # Parse the output
-            return parse_claude_output(
-                stdout=result.stdout,
-                stderr=result.stderr,
-                exit_code=result.returncode,
-            )
-
         except subprocess.TimeoutExpired as e:
             # Handle timeout
-            stdout = e.stdout.decode() if e.stdout else ""
-            stderr = e.stderr.decode() if e.stderr else ""
+            return self._timeout_response(e)
 
+        except subprocess.SubprocessError as e:
+            # Handle other subprocess errors
             return ClaudeResponse(
                 success=False,
                 explanation="",
                 files_changed=[],
-                error_message=f"Claude Code timed out after {self.timeout} seconds",
-                raw_output=f"STDOUT:\n{stdout}\n\nSTDERR:\n{stderr}",
+                error_message=f"Subprocess error: {str(e)}",
+                raw_output=str(e),
             )
 
-        except subprocess.SubprocessError as e:
-            # Handle other subprocess errors
+        except OSError as e:
+            # Handle OS errors (e.g., command not found despite is_available check)
             return ClaudeResponse(
                 success=False,
                 explanation="",
                 files_changed=[],
-                error_message=f"Subprocess error: {str(e)}",
+                error_message=f"OS error executing Claude Code: {str(e)}",
                 raw_output=str(e),
             )
 
+    async def _execute_async(self, command: list[str]) -> ClaudeResponse:
+        """Run a Claude Code command on the event loop and parse its output.
+
+        Args:
+            command: Full command line, starting with the claude executable
+
+        Returns:
+            ClaudeResponse parsed from the command output, or a failed
+            response describing a timeout or launch error
+        """
+        try:
+            process = await asyncio.create_subprocess_exec(
+                *command,
+                cwd=self.working_dir,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+            )
         except OSError as e:
-            # Handle OS errors (e.g., command not found despite is_available check)
             return ClaudeResponse(
                 success=False,
                 explanation="",
@@ -182,6 +317,73 @@ class ClaudeCodeClient:
                 raw_output=str(e),
             )
 
+        try:
+            stdout, stderr = await asyncio.wait_for(
+                process.communicate(), timeout=self.timeout
+            )
+        except TimeoutError:
+            process.kill()
+            await process.wait()
+            return self._timeout_response(
+                subprocess.TimeoutExpired(command, self.timeout)
+            )
+        except asyncio.CancelledError:
+            # Don't leave Claude Code running, and possibly editing files,
+            # after the caller has given up on it
+            if process.returncode is None:
+                process.kill()
+                await process.wait()
+            raise
+
+        return parse_claude_output(
+            stdout=stdout.decode("utf-8", errors="replace"),
+            stderr=stderr.decode("utf-8", errors="replace"),
+            exit_code=process.returncode if process.returncode is not None else -1,
+        )
+
+    def _timeout_response(self, error: subprocess.TimeoutExpired) -> ClaudeResponse:
+        """Build the response for a Claude Code call that timed out.
+
+        The partial output captured before the timeout is always raw bytes,
+        and may end in the middle of a multi-byte character, so it is decoded
+        leniently.
+
+        Args:
+            error: Timeout raised by subprocess.run
+
+        Returns:
+            Failed ClaudeResponse carrying whatever output was captured
+        """
+        stdout = _decode_partial_output(error.stdout)
+        stderr = _decode_partial_output(error.stderr)
+
+        return ClaudeResponse(
+            success=False,
+            explanation="",
+            files_changed=[],
+            error_message=f"Claude Code timed out after {self.timeout} seconds",
+            raw_output="".join(("STDOUT:\n", stdout, "\n\nSTDERR:\n", stderr)),
+        )
+
+    def _allowed_tools_arg(self, context: HealingContext) -> str:
+        """Get the comma-separated --allowedTools value for a request.
+
+        The healing config is the same object for every retry of a session,
+        so the joined value is reused until a different config is passed.
+
+        Args:
+            context: Healing context with configuration
+
+        Returns:
+            Comma-separated tool names, or empty string for no restrictions
+        """
+        healing_config = context.config.healing
+        cached = self._allowed_tools_cache
+        if cached is None or cached[0] is not healing_config:
+            cached = (healing_config, ",".join(self._get_allowed_tools(context)))
+            self._allowed_tools_cache = cached
+        return cached[1]
+
     def _get_allowed_tools(self, context: HealingContext) -> list[str]:
         """Determine which tools Claude Code should be allowed to use.
 
@@ -241,13 +443,37 @@ class ClaudeCodeClient:
             RuntimeError: If Claude CLI is not available
             subprocess.TimeoutExpired: If the command exceeds the timeout
         """
-        if not self.is_available():
-            raise RuntimeError(
-                "Claude Code CLI is not available. Please install it first:\n"
-                "  npm install -g @anthropic-ai/claude-code\n"
-                "Then authenticate with:\n"
-                "  claude login"
-            )
+        return self._execute(self._build_diagnosis_command(context))
+
+    async def request_diagnosis_async(self, context: HealingContext) -> ClaudeResponse:
+        """Request a diagnosis without blocking the event loop.
+
+        Behaves like request_diagnosis, but awaits the Claude Code process.
+
+        Args:
+            context: Complete healing context with error information
+
+        Returns:
+            ClaudeResponse with the diagnostic analysis
+
+        Raises:
+            RuntimeError: If Claude CLI is not available
+        """
+        return await self._execute_async(self._build_diagnosis_command(context))
+
+    def _build_diagnosis_command(self, context: HealingContext) -> list[str]:
+        """Build the read-only Claude Code command line for a diagnosis request.
+
+        Args:
+            context: Complete healing context with error information
+
+        Returns:
+            Command line to execute
+
+        Raises:
+            RuntimeError: If Claude CLI is not available
+        """
+        self._ensure_available()
 
         # Build the diagnosis prompt
         prompt = build_diagnosis_prompt(context)
@@ -255,63 +481,153 @@ class ClaudeCodeClient:
         # Build the command with restricted tools for diagnosis only
         # Only allow Read tool to prevent any file modifications
         command = [
-            "claude",
+            self._claude_executable(),
             "-p",
             prompt,
+            *_STRUCTURED_OUTPUT_ARGS,
             "--allowedTools",
             "Read",  # Only allow reading files, no editing or writing
         ]
 
-        try:
-            # Execute Claude Code
-            result = subprocess.run(
-                command,
-                cwd=self.working_dir,
-                capture_output=True,
-                text=True,
-                timeout=self.timeout,
-            )
+        return command
 
-            # Parse the output
-            return parse_claude_output(
-                stdout=result.stdout,
-                stderr=result.stderr,
-                exit_code=result.returncode,
-            )
+    def request_fix_batch(
+        self, contexts: Sequence[HealingContext]
+    ) -> list[ClaudeResponse]:
+        """Request fixes for several failed scripts in one Claude Code call.
 
-        except subprocess.TimeoutExpired as e:
-            # Handle timeout
-            stdout = e.stdout.decode() if e.stdout else ""
-            stderr = e.stderr.decode() if e.stderr else ""
+        The healing prompts are joined under numbered task delimiters and
+        Claude is asked to open each part of its reply with the matching
+        delimiter. The reply is split on those lines and each slice is parsed
+        on its own; Edit/Write tool events count for the task whose
+        delimiter last appeared before them, so changed files are
+        attributed to the right script.
+        This pays the CLI startup cost once instead of once per script.
 
-            return ClaudeResponse(
-                success=False,
-                explanation="",
-                files_changed=[],
-                error_message=f"Claude Code timed out after {self.timeout} seconds",
-                raw_output=f"STDOUT:\n{stdout}\n\nSTDERR:\n{stderr}",
-            )
+        Tool restrictions apply to a whole Claude Code call, so only contexts
+        with the same allowed tools share a call; a context whose tools
+        differ from every other is sent on its own with request_fix.
 
-        except subprocess.SubprocessError as e:
-            # Handle other subprocess errors
-            return ClaudeResponse(
-                success=False,
-                explanation="",
-                files_changed=[],
-                error_message=f"Subprocess error: {str(e)}",
-                raw_output=str(e),
-            )
+        Args:
+            contexts: Healing contexts, one per failed script
 
-        except OSError as e:
-            # Handle OS errors (e.g., command not found despite is_available check)
-            return ClaudeResponse(
-                success=False,
-                explanation="",
-                files_changed=[],
-                error_message=f"OS error executing Claude Code: {str(e)}",
-                raw_output=str(e),
+        Returns:
+            One ClaudeResponse per context, in the same order. A task missing
+            from the reply gets a failed response.
+
+        Raises:
+            RuntimeError: If Claude CLI is not available
+        """
+        groups: dict[frozenset[str], list[int]] = {}
+        for index, context in enumerate(contexts):
+            tools = frozenset(self._get_allowed_tools(context))
+            groups.setdefault(tools, []).append(index)
+
+        responses: dict[int, ClaudeResponse] = {}
+        for indices in groups.values():
+            group = [contexts[index] for index in indices]
+            responses.update(zip(indices, self._request_fix_group(group), strict=True))
+
+        return [responses[index] for index in range(len(contexts))]
+
+    def _request_fix_group(
+        self, contexts: Sequence[HealingContext]
+    ) -> list[ClaudeResponse]:
+        """Request fixes for contexts that share the same allowed tools.
+
+        Args:
+            contexts: Healing contexts with identical tool restrictions
+
+        Returns:
+            One ClaudeResponse per context, in the same order
+
+        Raises:
+            RuntimeError: If Claude CLI is not available
+        """
+        if len(contexts) == 1:
+            return [self.request_fix(contexts[0])]
+
+        result = self._run(self._build_batch_command(contexts))
+        if isinstance(result, ClaudeResponse):
+            # Timeout or launch error: every task shares the same outcome
+            return [dataclasses.replace(result) for _ in contexts]
+
+        sections = _split_task_output(result.stdout)
+        if not sections and result.returncode != 0:
+            # The CLI failed before replying (e.g. an auth or rate limit
+            # error): every task shares the classified error
+            return [
+                parse_claude_output(
+                    stdout=result.stdout,
+                    stderr=result.stderr,
+                    exit_code=result.returncode,
+                )
+                for _ in contexts
+            ]
+
+        responses = []
+        for number in range(1, len(contexts) + 1):
+            section = sections.get(number)
+            if section is None:
+                responses.append(
+                    ClaudeResponse(
+                        success=False,
+                        explanation="",
+                        files_changed=[],
+                        error_message=f"No output for task {number} in batched response",
+                        raw_output=result.stdout,
+                    )
+                )
+                continue
+            responses.append(
+                parse_claude_output(
+                    stdout=section,
+                    stderr=result.stderr,
+                    exit_code=result.returncode,
+                )
             )
 
+        return responses
+
+    def _build_batch_command(self, contexts: Sequence[HealingContext]) -> list[str]:
+        """Build the Claude Code command line for a batched fix request.
+
+        Args:
+            contexts: Healing contexts, one per task, all with the same
+                allowed tools
+
+        Returns:
+            Command line to execute
+
+        Raises:
+            RuntimeError: If Claude CLI is not available
+        """
+        self._ensure_available()
+
+        parts = [
+            f"You are given {len(contexts)} independent tasks. Complete each one "
+            "in order. Start your report for each task with its delimiter line "
+            f"exactly as shown, for example {_TASK_DELIMITER.format(1)}, and do "
+            "not mention other tasks in that report."
+        ]
+        for number, context in enumerate(contexts, 1):
+            parts.append(_TASK_DELIMITER.format(number))
+            parts.append(build_healing_prompt(context))
+
+        # Callers only batch contexts with the same allowed tools
+        allowed_tools = self._allowed_tools_arg(contexts[0])
+
+        command = [
+            self._claude_executable(),
+            "-p",
+            "\n\n".join(parts),
+            *_STRUCTURED_OUTPUT_ARGS,
+        ]
+        if allowed_tools:
+            command.extend(["--allowedTools", allowed_tools])
+
+        return command
+
     def request_fix_with_retry(
         self,
         context: HealingContext,
@@ -345,3 +661,127 @@ class ClaudeCodeClient:
 
         # This should never be reached, but satisfy type checker
         return response, max_attempts
+
+
+def _decode_partial_output(output: bytes | str | None) -> str:
+    """Decode output captured from a process that was killed mid-write.
+
+    Args:
+        output: Captured output, as attached to subprocess.TimeoutExpired
+
+    Returns:
+        Decoded text, with undecodable bytes replaced
+    """
+    if not output:
+        return ""
+    if isinstance(output, str):
+        return output
+    return output.decode("utf-8", errors="replace")
+
+
+def _split_task_output(output: str) -> dict[int, str]:
+    """Split a batched reply into per-task slices.
+
+    Args:
+        output: Stdout from a batched request, stream-json or plain text
+
+    Returns:
+        Mapping of task number to that task's part of the reply, in the
+        same format as the input
+    """
+    sections = _split_task_events(output)
+    if sections is not None:
+        return sections
+
+    matches = list(_TASK_DELIMITER_RE.finditer(output))
+    sections = {}
+    for i, match in enumerate(matches):
+        end = matches[i + 1].start() if i + 1 < len(matches) else len(output)
+        sections[int(match.group(1))] = output[match.end():end].strip()
+    return sections
+
+
+def _split_task_events(output: str) -> dict[int, str] | None:
+    """Split a batched stream-json reply into per-task event streams.
+
+    Assistant content blocks belong to the task whose delimiter line last
+    appeared in the assistant text, and text blocks are cut at delimiter
+    lines. Each task gets one assistant event with its blocks followed by
+    the final result event if it reports an error; a successful result is
+    left out since its text repeats the last task's report.
+
+    Args:
+        output: Stdout from a batched request
+
+    Returns:
+        Mapping of task number to newline-delimited JSON events, or None if
+        the output is not stream-json
+    """
+    if not output.lstrip().startswith("{"):
+        return None
+
+    blocks: dict[int, list[Any]] = {}
+    error_result: str | None = None
+    task = 0
+
+    for line in output.splitlines():
+        if not line.strip():
+            continue
+        try:
+            event = json.loads(line)
+        except ValueError:
+            return None
+        if not isinstance(event, dict):
+            return None
+
+        if event.get("type") == "result":
+            if event.get("is_error"):
+                error_result = line
+            continue
+
+        message = event.get("message")
+        if event.get("type") != "assistant" or not isinstance(message, dict):
+            continue
+        content = message.get("content")
+        if not isinstance(content, list):
+            continue
+        for block in content:
+            if isinstance(block, dict) and block.get("type") == "text":
+                task = _split_text_block(str(block.get("text") or ""), task, blocks)
+            else:
+                blocks.setdefault(task, []).append(block)
+
+    # Anything before the first delimiter cannot be attributed to a task
+    blocks.pop(0, None)
+    sections = {}
+    for number, task_blocks in blocks.items():
+        events = [json.dumps({"type": "assistant", "message": {"content": task_blocks}})]
+        if error_result is not None:
+            events.append(error_result)
+        sections[number] = "\n".join(events)
+    return sections
+
+
+def _split_text_block(text: str, task: int, blocks: dict[int, list[Any]]) -> int:
+    """Distribute an assistant text block over the tasks it reports on.
+
+    Args:
+        text: Text of the block
+        task: Task number current at the start of the block
+        blocks: Content blocks per task (updated in place)
+
+    Returns:
+        Task number current at the end of the block
+    """
+    start = 0
+    for match in _TASK_DELIMITER_RE.finditer(text):
+        piece = text[start:match.start()].strip()
+        if piece:
+            blocks.setdefault(task, []).append({"type": "text", "text": piece})
+        task = int(match.group(1))
+        blocks.setdefault(task, [])
+        start = match.end()
+    piece = text[start:].strip()
+    if piece:
+        blocks.setdefault(task, []).append({"type": "text", "text": piece})
+    return task
@@ -6,8 +6,84 @@ changes, and extract explanations from the AI's responses.
 
 from __future__ import annotations
 
+import json
 import re
+from collections.abc import Iterator
 from dataclasses import dataclass
+from itertools import islice
+from typing import Any
+
+# Extensions recognised when a file path is mentioned in free text
+_FILE_EXTENSIONS = r"(?:py|sh|js|ts|yaml|yml|json|toml|md)"
+
+# Single pass classifier for known CLI failure modes; the matching group
+# name identifies the error class. Keywords are lowercase literals and the
+# pattern is matched against lowercased output, which keeps the regex
+# engine's literal fast paths that re.IGNORECASE disables.
+_ERROR_CLASSIFIER_RE = re.compile(
+    r"(?P<auth>authentication failed|invalid api key|unauthorized|not authenticated"
+    r"|login required|session expired)"
+    r"|(?P<rate_limit>rate limit|too many requests|quota exceeded|overloaded_error)"
+)
+
+_ERROR_MESSAGES = {
+    "auth": "Claude Code authentication failed. Please run 'claude login' first.",
+    "rate_limit": "Claude Code rate limit exceeded. Please try again later.",
+}
+
+# Tool usage indicators (Edit, Write tools)
+# Example: Edit[file_path="/path/to/file.py"]
+_TOOL_RE = re.compile(r'(?:Edit|Write)\[file_path=["\']([^"\']+)["\']')
+
+# Action descriptions; quoted paths are tried first so the quotes are not
+# captured by the bare path alternative
+# Example: "Edited /path/to/file.py" or "Modified file.py"
+_ACTION_RE = re.compile(
+    r'(?:Edited|Modified|Updated|Wrote to)\s+'
+    rf'(?:"([^"]+)"|`([^`]+)`|([^\s,\n]+\.{_FILE_EXTENSIONS}))',
+    re.IGNORECASE,
+)
+
+# File path mentions after verbs indicating modification
+_CHANGE_CONTEXT_RE = re.compile(
+    rf'(?:changed|fixed|updated|modified|edited)\s+(?:the\s+)?(?:file\s+)?([^\s,\n]+\.{_FILE_EXTENSIONS})',
+    re.IGNORECASE,
+)
+
+# Success messages with file paths
+# Example: "Successfully updated /path/to/file.py"
+_SUCCESS_RE = re.compile(
+    rf'Successfully\s+(?:updated|modified|edited|changed)\s+([^\s,\n]+\.{_FILE_EXTENSIONS})',
+    re.IGNORECASE,
+)
+
+# Claude Code tools whose use means a file was modified, mapped to the input
+# field holding the path (as reported by --output-format stream-json)
+_FILE_EDIT_TOOLS = {
+    "Edit": "file_path",
+    "MultiEdit": "file_path",
+    "Write": "file_path",
+    "NotebookEdit": "notebook_path",
+}
+
+# Every pattern captures the path in exactly one participating group
+_FILE_CHANGE_PATTERNS = (_TOOL_RE, _ACTION_RE, _CHANGE_CONTEXT_RE, _SUCCESS_RE)
+
+# Paths containing any of these words are treated as false positives
+_EXCLUDED_PATH_WORDS = ("example", "template", "sample")
+
+# Sentences that typically describe what Claude fixed, e.g. "I've fixed...",
+# "The issue was...", "Updated...", "To fix this, I..."
+_EXPLANATION_RE = re.compile(
+    r"(?:I've|I have)\s+(?:fixed|updated|modified|changed)\s+[^.!?\n]+[.!?]"
+    r"|(?:The\s+)?(?:issue|problem|error)\s+(?:was|is)\s+[^.!?\n]+[.!?]"
+    r"|(?:Fixed|Updated|Modified|Changed)\s+[^.!?\n]+[.!?]"
+    r"|(?:To fix this|The fix),?\s+I\s+[^.!?\n]+[.!?]",
+    re.IGNORECASE,
+)
+
+# Maximum number of explanation sentences combined into the summary
+_MAX_EXPLANATION_SENTENCES = 3
 
 
 @dataclass
@@ -20,6 +96,8 @@ class ClaudeResponse:
         files_changed: List of file paths that were modified
         error_message: Error message if the healing attempt failed
         raw_output: Complete raw output from Claude Code (stdout + stderr)
+        response_text: Claude's reply text for display, without tool events
+            or stderr
     """
 
     success: bool
@@ -27,6 +105,33 @@ class ClaudeResponse:
     files_changed: list[str]
     error_message: str | None
     raw_output: str
+    response_text: str = ""
+
+
+@dataclass(frozen=True)
+class _StreamOutput:
+    """Result of parsing ``--output-format stream-json`` events.
+
+    Attributes:
+        files_changed: Paths passed to file editing tools, in order
+        assistant_text: Text blocks from assistant messages
+        result_text: Text of the final result event
+        is_error: Whether the final result event reported an error
+    """
+
+    files_changed: list[str]
+    assistant_text: str
+    result_text: str
+    is_error: bool
+
+    @property
+    def text(self) -> str:
+        """Assistant text followed by the final result, for display."""
+        if not self.result_text or self.assistant_text.endswith(self.result_text):
+            return self.assistant_text
+        if not self.assistant_text:
+            return self.result_text
+        return f"{self.assistant_text}\n\n{self.result_text}"
 
 
 def parse_claude_output(stdout: str, stderr: str, exit_code: int) -> ClaudeResponse:
@@ -46,49 +151,37 @@ def parse_claude_output(stdout: str, stderr: str, exit_code: int) -> ClaudeRespo
     Returns:
         ClaudeResponse with parsed information about the healing attempt
     """
-    raw_output = f"{stdout}\n{stderr}".strip()
-
-    # Check for authentication errors
-    auth_error_patterns = [
-        r"authentication failed",
-        r"invalid api key",
-        r"unauthorized",
-        r"not authenticated",
-        r"login required",
-        r"session expired",
-    ]
-    for pattern in auth_error_patterns:
-        if re.search(pattern, raw_output, re.IGNORECASE):
-            return ClaudeResponse(
-                success=False,
-                explanation="",
-                files_changed=[],
-                error_message="Claude Code authentication failed. Please run 'claude login' first.",
-                raw_output=raw_output,
-            )
-
-    # Check for rate limit errors
-    rate_limit_patterns = [
-        r"rate limit",
-        r"too many requests",
-        r"quota exceeded",
-        r"overloaded_error",
-    ]
-    for pattern in rate_limit_patterns:
-        if re.search(pattern, raw_output, re.IGNORECASE):
-            return ClaudeResponse(
-                success=False,
-                explanation="",
-                files_changed=[],
-                error_message="Claude Code rate limit exceeded. Please try again later.",
-                raw_output=raw_output,
-            )
+    # Parse structured events when Claude Code ran with --output-format
+    # stream-json. The event stream carries tool payloads such as file
+    # contents and command output, so only the final result is classified
+    # for errors and only the assistant text is kept for display.
+    raw_output = _combine_output(stdout, stderr)
+    structured = _parse_stream_json(stdout)
+    if structured is None:
+        classified_output = raw_output
+        response_text = stdout.strip()
+    else:
+        classified_output = _combine_output(structured.result_text, stderr)
+        response_text = structured.text
+
+    # Check for authentication and rate limit errors
+    error_match = _ERROR_CLASSIFIER_RE.search(classified_output.lower())
+    if error_match and error_match.lastgroup:
+        return ClaudeResponse(
+            success=False,
+            explanation="",
+            files_changed=[],
+            error_message=_ERROR_MESSAGES[error_match.lastgroup],
+            raw_output=raw_output,
+            response_text=response_text,
+        )
 
     # Check for timeout or other errors
     if exit_code != 0:
-        # Try to extract a meaningful error message from stderr
-        error_lines = [line.strip() for line in stderr.split("\n") if line.strip()]
-        error_message = error_lines[-1] if error_lines else f"Claude Code exited with code {exit_code}"
+        # Try to extract a meaningful error message from stderr: the last
+        # non-blank line, found by scanning back from the end of the buffer
+        last_line = stderr.rstrip().rpartition("\n")[2].strip()
+        error_message = last_line or f"Claude Code exited with code {exit_code}"
 
         return ClaudeResponse(
             success=False,
@@ -96,11 +189,26 @@ def parse_claude_output(stdout: str, stderr: str, exit_code: int) -> ClaudeRespo
             files_changed=[],
             error_message=error_message,
             raw_output=raw_output,
+            response_text=response_text,
         )
 
-    # Parse successful output
-    files_changed = _extract_changed_files(stdout)
-    explanation = _extract_explanation(stdout)
+    # Parse successful output, preferring the structured events and falling
+    # back to scraping text
+    if structured is not None:
+        files_changed = structured.files_changed
+        if structured.is_error:
+            return ClaudeResponse(
+                success=False,
+                explanation="",
+                files_changed=files_changed,
+                error_message=structured.result_text or "Claude Code reported an error",
+                raw_output=raw_output,
+                response_text=response_text,
+            )
+        explanation = _extract_explanation(structured.assistant_text)
+    else:
+        files_changed = _extract_changed_files(stdout)
+        explanation = _extract_explanation(stdout)
 
     # Determine success based on whether changes were made
     # If Claude ran successfully (exit_code 0) but made no changes,
@@ -113,9 +221,106 @@ def parse_claude_output(stdout: str, stderr: str, exit_code: int) -> ClaudeRespo
         files_changed=files_changed,
         error_message=None if success else "No changes were made by Claude Code",
         raw_output=raw_output,
+        response_text=response_text,
+    )
+
+
+def _combine_output(stdout: str, stderr: str) -> str:
+    """Combine stdout and stderr into a single stripped string.
+
+    Usually only one of the streams has content. In that case the stream is
+    returned as-is (``str.strip`` does not copy a string that has nothing to
+    strip) instead of being concatenated into a new buffer.
+
+    Args:
+        stdout: Standard output from the Claude Code process
+        stderr: Standard error from the Claude Code process
+
+    Returns:
+        Both streams joined by a newline, with surrounding whitespace removed
+    """
+    if not stderr:
+        return stdout.strip()
+    if not stdout:
+        return stderr.strip()
+    return f"{stdout}\n{stderr}".strip()
+
+
+def _parse_stream_json(output: str) -> _StreamOutput | None:
+    """Parse newline-delimited JSON events from ``--output-format stream-json``.
+
+    File changes are read from Edit/Write tool calls, which is exact where the
+    text patterns are heuristic. Output that is not entirely JSON is rejected
+    so the caller can fall back to text parsing.
+
+    Args:
+        output: Claude Code stdout output
+
+    Returns:
+        Parsed events, or None if the output is not stream-json
+    """
+    if not output.lstrip().startswith("{"):
+        return None
+
+    files: dict[str, None] = {}
+    text_blocks: list[str] = []
+    result_text = ""
+    is_error = False
+
+    for line in output.splitlines():
+        if not line.strip():
+            continue
+        try:
+            event = json.loads(line)
+        except ValueError:
+            return None
+        if not isinstance(event, dict):
+            return None
+
+        if event.get("type") == "result":
+            result_text = str(event.get("result") or "")
+            is_error = bool(event.get("is_error"))
+            continue
+
+        message = event.get("message")
+        if event.get("type") != "assistant" or not isinstance(message, dict):
+            continue
+        content = message.get("content")
+        if not isinstance(content, list):
+            continue
+        for block in content:
+            _collect_content_block(block, files, text_blocks)
+
+    return _StreamOutput(
+        files_changed=list(files),
+        assistant_text="\n\n".join(text_blocks),
+        result_text=result_text,
+        is_error=is_error,
     )
 
 
+def _collect_content_block(
+    block: Any, files: dict[str, None], text_blocks: list[str]
+) -> None:
+    """Record the file path or text carried by one assistant content block.
+
+    Args:
+        block: Content block from an assistant message event
+        files: Changed files seen so far, in order (updated in place)
+        text_blocks: Assistant text seen so far (updated in place)
+    """
+    if not isinstance(block, dict):
+        return
+    if block.get("type") == "text" and isinstance(block.get("text"), str):
+        text_blocks.append(block["text"])
+    elif block.get("type") == "tool_use" and block.get("name") in _FILE_EDIT_TOOLS:
+        tool_input = block.get("input")
+        if isinstance(tool_input, dict):
+            path = tool_input.get(_FILE_EDIT_TOOLS[block["name"]])
+            if isinstance(path, str) and path:
+                files.setdefault(path, None)
+
+
 def _extract_changed_files(output: str) -> list[str]:
     """Extract list of changed files from Claude Code output.
 
@@ -132,51 +337,30 @@ def _extract_changed_files(output: str) -> list[str]:
     Returns:
         List of file paths that were changed
     """
-    files = []
-
-    # Pattern 1: Tool usage indicators (Edit, Write tools)
-    # Example: Edit[file_path="/path/to/file.py"]
-    tool_patterns = [
-        r'Edit\[file_path=["\']([^"\']+)["\']',
-        r'Write\[file_path=["\']([^"\']+)["\']',
-    ]
-    for pattern in tool_patterns:
-        matches = re.findall(pattern, output)
-        files.extend(matches)
-
-    # Pattern 2: Action descriptions
-    # Example: "Edited /path/to/file.py" or "Modified file.py"
-    action_patterns = [
-        r'(?:Edited|Modified|Updated|Wrote to)\s+([^\s,\n]+\.(?:py|sh|js|ts|yaml|yml|json|toml|md))',
-        r'(?:Edited|Modified|Updated|Wrote to)\s+"([^"]+)"',
-        r'(?:Edited|Modified|Updated|Wrote to)\s+`([^`]+)`',
-    ]
-    for pattern in action_patterns:
-        matches = re.findall(pattern, output, re.IGNORECASE)
-        files.extend(matches)
+    # Patterns are scanned in order: tool usage indicators, action
+    # descriptions, file mentions after change verbs, success messages.
+    # Keying a dict on the matches deduplicates while preserving order.
+    unique_files = dict.fromkeys(
+        match.group(match.lastindex or 0)
+        for pattern in _FILE_CHANGE_PATTERNS
+        for match in pattern.finditer(output)
+    )
 
-    # Pattern 3: File path mentions in context of changes
-    # Look for file paths after verbs indicating modification
-    change_context_pattern = r'(?:changed|fixed|updated|modified|edited)\s+(?:the\s+)?(?:file\s+)?([^\s,\n]+\.(?:py|sh|js|ts|yaml|yml|json|toml|md))'
-    matches = re.findall(change_context_pattern, output, re.IGNORECASE)
-    files.extend(matches)
+    # Filter out common false positives
+    return [f for f in unique_files if not _is_false_positive(f)]
 
-    # Pattern 4: Success messages with file paths
-    # Example: "Successfully updated /path/to/file.py"
-    success_pattern = r'Successfully\s+(?:updated|modified|edited|changed)\s+([^\s,\n]+\.(?:py|sh|js|ts|yaml|yml|json|toml|md))'
-    matches = re.findall(success_pattern, output, re.IGNORECASE)
-    files.extend(matches)
 
-    # Deduplicate and clean up file paths
-    unique_files = list(dict.fromkeys(files))  # Preserve order while removing duplicates
+def _is_false_positive(path: str) -> bool:
+    """Check whether an extracted path looks like an example rather than a real change.
 
-    # Filter out common false positives
-    filtered_files = [
-        f for f in unique_files
-        if not any(exclude in f.lower() for exclude in ["example", "template", "sample"])
-    ]
+    Args:
+        path: File path extracted from Claude Code output
 
-    return filtered_files
+    Returns:
+        True if the path should be ignored
+    """
+    lowered = path.lower()
+    return any(word in lowered for word in _EXCLUDED_PATH_WORDS)
 
 
 def _extract_explanation(output: str) -> str:
@@ -198,28 +382,23 @@ def _extract_explanation(output: str) -> str:
     # - "I've updated..."
     # - "The problem was..."
 
-    explanation_patterns = [
-        r"((?:I've|I have)\s+(?:fixed|updated|modified|changed)\s+[^.!?\n]+[.!?])",
-        r"((?:The\s+)?(?:issue|problem|error)\s+(?:was|is)\s+[^.!?\n]+[.!?])",
-        r"((?:Fixed|Updated|Modified|Changed)\s+[^.!?\n]+[.!?])",
-        r"((?:To fix this|The fix),?\s+I\s+[^.!?\n]+[.!?])",
+    # Stop scanning as soon as enough sentences have been found
+    explanations = [
+        match.group(0)
+        for match in islice(_EXPLANATION_RE.finditer(output), _MAX_EXPLANATION_SENTENCES)
     ]
 
-    explanations = []
-    for pattern in explanation_patterns:
-        matches = re.findall(pattern, output, re.IGNORECASE)
-        explanations.extend(matches)
-
     if explanations:
         # Combine the first few explanations into a coherent message
-        return " ".join(explanations[:3])
+        return " ".join(explanations)
 
-    # Try to extract the first substantial paragraph (at least 50 chars)
-    paragraphs = [p.strip() for p in output.split("\n\n") if len(p.strip()) >= 50]
+    # Try to extract the first substantial paragraph (at least 50 chars),
+    # looking no further than the first few candidates
+    paragraphs = list(islice(_iter_paragraphs(output, min_length=50), 5))
     if paragraphs:
         # Find the first paragraph that looks like an explanation
         # (contains action verbs and file-related words)
-        for para in paragraphs[:5]:
+        for para in paragraphs:
             if any(word in para.lower() for word in ["fix", "change", "update", "modify", "error", "issue", "problem"]):
                 # Truncate to reasonable length
                 if len(para) > 300:
@@ -234,3 +413,29 @@ def _extract_explanation(output: str) -> str:
 
     # If we can't find a good explanation, return a generic message
     return "Claude Code completed the healing attempt."
+
+
+def _iter_paragraphs(output: str, min_length: int) -> Iterator[str]:
+    """Lazily yield stripped paragraphs of at least ``min_length`` characters.
+
+    Paragraphs are separated by blank lines. Unlike splitting the whole
+    output up front, this only slices out paragraphs as they are consumed,
+    so callers that stop early never copy the rest of the output.
+
+    Args:
+        output: Claude Code stdout output
+        min_length: Minimum stripped length for a paragraph to be yielded
+
+    Yields:
+        Stripped paragraph text
+    """
+    start = 0
+    end_of_output = len(output)
+    while start <= end_of_output:
+        end = output.find("\n\n", start)
+        if end == -1:
+            end = end_of_output
+        paragraph = output[start:end].strip()
+        if len(paragraph) >= min_length:
+            yield paragraph
+        start = end + 2
@@ -6,10 +6,89 @@ incorporating all relevant context from the failed script execution.
 
 from __future__ import annotations
 
-from lazarus.core.context import HealingContext
-
+import io
+from itertools import islice
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from lazarus.config.schema import ScriptConfig
+    from lazarus.core.context import (
+        ExecutionResult,
+        GitContext,
+        HealingContext,
+        PreviousAttempt,
+        SystemContext,
+    )
 
-def build_healing_prompt(context: HealingContext) -> str:
+# Inserted where the middle of long output is cut
+_TRUNCATION_MARKER = "\n\n... [truncated] ...\n\n"
+_SHORT_TRUNCATION_MARKER = "\n... [truncated] ...\n"
+
+# Characters kept from stdout/stderr and from uncommitted changes. When the
+# raw inputs together exceed _MAX_INPUT_SIZE, the compact limits are used so
+# the prompt stays bounded even for huge scripts.
+_OUTPUT_LIMIT = 5000
+_DIFF_LIMIT = 3000
+_COMPACT_OUTPUT_LIMIT = 2000
+_COMPACT_DIFF_LIMIT = 1000
+_MAX_INPUT_SIZE = 180_000
+
+# Fixed-shape sections, filled with str.format_map
+_ERROR_TEMPLATE = (
+    "# ERROR INFORMATION\n"
+    "Exit Code: {exit_code}\n"
+    "Duration: {duration:.2f}s\n"
+    "Timestamp: {timestamp}\n\n"
+)
+_SCRIPT_TEMPLATE = "# SCRIPT\nFile: {path}\n```\n{content}\n```\n\n"
+_COMMIT_TEMPLATE = "{number}. {hash} - {message}\n   by {author} on {date}\n"
+_COMMIT_DIFF_TEMPLATE = "   Changes:\n{diff}\n"
+_ATTEMPT_TEMPLATE = (
+    "## Attempt {number}:\n"
+    "What was tried: {summary}\n"
+    "{files}"
+    "Result: Still failed with error:\n"
+    "```\n{error}\n```\n\n"
+)
+_SYSTEM_TEMPLATE = (
+    "# SYSTEM INFORMATION\n"
+    "OS: {os_name}\n"
+    "OS Version: {os_version}\n"
+    "Python: {python_version}\n"
+    "Shell: {shell}\n"
+    "Working Directory: {cwd}\n\n"
+)
+
+# Static instructions; the healing reminder follows any file constraints
+_HEALING_INSTRUCTIONS = (
+    "# INSTRUCTIONS\n"
+    "1. Analyze the error and identify the root cause\n"
+    "2. Make ONLY the minimal changes necessary to fix the issue\n"
+    "3. DO NOT refactor or improve unrelated code\n"
+    "4. DO NOT add features or make style changes\n"
+    "5. Preserve the original intent and logic of the script\n"
+    "6. After making changes, briefly explain what you fixed and why\n\n"
+)
+_HEALING_REMINDER = "\nRemember: Be surgical and precise. Fix only what's broken."
+_DIAGNOSIS_INSTRUCTIONS = (
+    "# INSTRUCTIONS\n"
+    "Please provide a detailed diagnosis including:\n"
+    "1. What is the root cause of the error?\n"
+    "2. Why is this error happening?\n"
+    "3. What would need to be changed to fix it?\n"
+    "4. Are there any related issues or concerns?\n"
+    "5. What is the recommended approach to fix this?\n\n"
+    "Remember: This is DIAGNOSIS ONLY - do not modify any files.\n"
+    "Explain what's wrong in clear, actionable terms."
+)
+
+
+def build_healing_prompt(
+    context: HealingContext,
+    extra_section: str | None = None,
+) -> str:
     """Build a structured healing prompt for Claude Code.
 
     This function creates a comprehensive prompt that includes:
@@ -22,184 +101,58 @@ def build_healing_prompt(context: HealingContext) -> str:
 
     Args:
         context: Complete healing context with all relevant information
+        extra_section: Optional pre-formatted section inserted just before
+            the instructions
 
     Returns:
         Formatted prompt string ready to send to Claude Code
     """
-    prompt_parts = []
+    script_config = _find_script_config(context)
+    buf = io.StringIO()
 
     # Task section
-    prompt_parts.append("# TASK")
-    prompt_parts.append(
-        f"Fix the failing script at: {context.script_path}\n"
-    )
-    if context.config.scripts:
-        # Try to find matching script config
-        script_configs = [
-            s for s in context.config.scripts
-            if s.path.name == context.script_path.name
-        ]
-        if script_configs and script_configs[0].description:
-            prompt_parts.append(f"Description: {script_configs[0].description}\n")
-
-    # Error section
-    prompt_parts.append("# ERROR INFORMATION")
-    prompt_parts.append(f"Exit Code: {context.execution_result.exit_code}")
-    prompt_parts.append(f"Duration: {context.execution_result.duration:.2f}s")
-    prompt_parts.append(f"Timestamp: {context.execution_result.timestamp.isoformat()}\n")
-
-    if context.execution_result.stdout.strip():
-        prompt_parts.append("## Standard Output:")
-        prompt_parts.append("```")
-        # Truncate very long output
-        stdout = context.execution_result.stdout
-        if len(stdout) > 5000:
-            stdout = stdout[:2500] + "\n\n... [truncated] ...\n\n" + stdout[-2500:]
-        prompt_parts.append(stdout)
-        prompt_parts.append("```\n")
-
-    if context.execution_result.stderr.strip():
-        prompt_parts.append("## Standard Error:")
-        prompt_parts.append("```")
-        # Truncate very long error output
-        stderr = context.execution_result.stderr
-        if len(stderr) > 5000:
-            stderr = stderr[:2500] + "\n\n... [truncated] ...\n\n" + stderr[-2500:]
-        prompt_parts.append(stderr)
-        prompt_parts.append("```\n")
-
-    # Script section
-    prompt_parts.append("# SCRIPT")
-    prompt_parts.append(f"File: {context.script_path}")
-    prompt_parts.append("```")
-    prompt_parts.append(context.script_content)
-    prompt_parts.append("```\n")
-
-    # Git context section
-    if context.git_context:
-        prompt_parts.append("# GIT CONTEXT")
-        prompt_parts.append(f"Branch: {context.git_context.branch}")
-        prompt_parts.append(f"Repository: {context.git_context.repo_root}\n")
-
-        if context.git_context.recent_commits:
-            prompt_parts.append("## Recent Commits:")
-            for i, commit in enumerate(context.git_context.recent_commits[:3], 1):
-                prompt_parts.append(f"{i}. {commit.hash[:8]} - {commit.message}")
-                prompt_parts.append(f"   by {commit.author} on {commit.date}")
-                if commit.diff and len(commit.diff) < 2000:
-                    # Only include compact diffs
-                    prompt_parts.append(f"   Changes:\n{commit.diff[:1000]}")
-            prompt_parts.append("")
-
-        if context.git_context.uncommitted_changes.strip():
-            prompt_parts.append("## Uncommitted Changes:")
-            prompt_parts.append("```diff")
-            # Truncate large diffs
-            changes = context.git_context.uncommitted_changes
-            if len(changes) > 3000:
-                changes = changes[:1500] + "\n\n... [truncated] ...\n\n" + changes[-1500:]
-            prompt_parts.append(changes)
-            prompt_parts.append("```\n")
-
-    # System section
-    prompt_parts.append("# SYSTEM INFORMATION")
-    prompt_parts.append(f"OS: {context.system_context.os_name}")
-    prompt_parts.append(f"OS Version: {context.system_context.os_version}")
-    prompt_parts.append(f"Python: {context.system_context.python_version.split()[0]}")
-    prompt_parts.append(f"Shell: {context.system_context.shell}")
-    prompt_parts.append(f"Working Directory: {context.system_context.cwd}\n")
+    buf.write("# TASK\n")
+    buf.write(f"Fix the failing script at: {context.script_path}\n\n")
 
-    # Success criteria (if defined)
-    if context.config.scripts:
-        script_configs = [
-            s for s in context.config.scripts
-            if s.path.name == context.script_path.name
-        ]
-        if script_configs and script_configs[0].success_criteria:
-            prompt_parts.append("# SUCCESS CRITERIA")
-            criteria = script_configs[0].success_criteria
-            for key, value in criteria.items():
-                prompt_parts.append(f"- {key}: {value}")
-            prompt_parts.append("")
-
-    # Custom prompt section (if provided)
-    if context.config.scripts:
-        script_configs = [
-            s for s in context.config.scripts
-            if s.path.name == context.script_path.name
-        ]
-        if script_configs and script_configs[0].custom_prompt:
-            prompt_parts.append("# ADDITIONAL CONTEXT")
-            prompt_parts.append(script_configs[0].custom_prompt)
-            prompt_parts.append("")
+    _write_common_sections(buf, context, script_config)
 
     # Previous attempts section
-    if context.previous_attempts:
-        prompt_parts.append("# PREVIOUS HEALING ATTEMPTS")
-        prompt_parts.append(
-            "This script has been attempted before. Here's what was tried:\n"
-        )
-
-        for attempt in context.previous_attempts:
-            prompt_parts.append(f"## Attempt {attempt.attempt_number}:")
-            prompt_parts.append(f"What was tried: {attempt.claude_response_summary}")
-
-            if attempt.changes_made:
-                prompt_parts.append("Files modified:")
-                for file in attempt.changes_made:
-                    prompt_parts.append(f"  - {file}")
+    previous_attempts = context.previous_attempts
+    if previous_attempts:
+        buf.write("# PREVIOUS HEALING ATTEMPTS\n")
+        buf.write("This script has been attempted before. Here's what was tried:\n\n")
 
-            prompt_parts.append("Result: Still failed with error:")
-            prompt_parts.append("```")
-            # Truncate very long errors
-            error = attempt.error_after
-            if len(error) > 1000:
-                error = error[:500] + "\n... [truncated] ...\n" + error[-500:]
-            prompt_parts.append(error)
-            prompt_parts.append("```\n")
+        buf.write("".join(_format_attempt(attempt) for attempt in previous_attempts))
 
-        prompt_parts.append(
+        buf.write(
             "IMPORTANT: The above approaches did NOT work. "
-            "Please try a DIFFERENT approach or technique.\n"
+            "Please try a DIFFERENT approach or technique.\n\n"
         )
 
+    if extra_section:
+        buf.write(extra_section)
+
     # Instructions section
-    prompt_parts.append("# INSTRUCTIONS")
-    prompt_parts.append(
-        "1. Analyze the error and identify the root cause\n"
-        "2. Make ONLY the minimal changes necessary to fix the issue\n"
-        "3. DO NOT refactor or improve unrelated code\n"
-        "4. DO NOT add features or make style changes\n"
-        "5. Preserve the original intent and logic of the script\n"
-        "6. After making changes, briefly explain what you fixed and why\n"
-    )
+    buf.write(_HEALING_INSTRUCTIONS)
 
     # File constraints (if defined)
-    if context.config.scripts:
-        script_configs = [
-            s for s in context.config.scripts
-            if s.path.name == context.script_path.name
-        ]
-        if script_configs:
-            config = script_configs[0]
-            if config.allowed_files:
-                prompt_parts.append("\n## Allowed Files:")
-                prompt_parts.append("You may only modify these files:")
-                for pattern in config.allowed_files:
-                    prompt_parts.append(f"- {pattern}")
-
-            if config.forbidden_files:
-                prompt_parts.append("\n## Forbidden Files:")
-                prompt_parts.append("You must NEVER modify these files:")
-                for pattern in config.forbidden_files:
-                    prompt_parts.append(f"- {pattern}")
+    if script_config:
+        if script_config.allowed_files:
+            buf.write("\n## Allowed Files:\n")
+            buf.write("You may only modify these files:\n")
+            buf.write("".join("- " + pattern + "\n" for pattern in script_config.allowed_files))
+
+        if script_config.forbidden_files:
+            buf.write("\n## Forbidden Files:\n")
+            buf.write("You must NEVER modify these files:\n")
+            buf.write(
+                "".join("- " + pattern + "\n" for pattern in script_config.forbidden_files)
+            )
 
     # Add emphasis on minimal changes
-    prompt_parts.append(
-        "\nRemember: Be surgical and precise. Fix only what's broken."
-    )
+    buf.write(_HEALING_REMINDER)
 
-    return "\n".join(prompt_parts)
+    return buf.getvalue()
 
 
 def build_diagnosis_prompt(context: HealingContext) -> str:
@@ -214,132 +167,25 @@ def build_diagnosis_prompt(context: HealingContext) -> str:
     Returns:
         Formatted diagnosis prompt string
     """
-    prompt_parts = []
+    script_config = _find_script_config(context)
+    buf = io.StringIO()
 
     # Task section
-    prompt_parts.append("# TASK")
-    prompt_parts.append(
-        f"Diagnose what's wrong with the failing script at: {context.script_path}\n"
+    buf.write("# TASK\n")
+    buf.write(
+        f"Diagnose what's wrong with the failing script at: {context.script_path}\n\n"
     )
-    prompt_parts.append(
+    buf.write(
         "IMPORTANT: This is a DIAGNOSIS ONLY task. DO NOT modify any files.\n"
-        "Instead, provide a detailed analysis of what's wrong and what would need to be fixed.\n"
+        "Instead, provide a detailed analysis of what's wrong and what would need to be fixed.\n\n"
     )
 
-    if context.config.scripts:
-        # Try to find matching script config
-        script_configs = [
-            s for s in context.config.scripts
-            if s.path.name == context.script_path.name
-        ]
-        if script_configs and script_configs[0].description:
-            prompt_parts.append(f"Description: {script_configs[0].description}\n")
-
-    # Error section
-    prompt_parts.append("# ERROR INFORMATION")
-    prompt_parts.append(f"Exit Code: {context.execution_result.exit_code}")
-    prompt_parts.append(f"Duration: {context.execution_result.duration:.2f}s")
-    prompt_parts.append(f"Timestamp: {context.execution_result.timestamp.isoformat()}\n")
-
-    if context.execution_result.stdout.strip():
-        prompt_parts.append("## Standard Output:")
-        prompt_parts.append("```")
-        # Truncate very long output
-        stdout = context.execution_result.stdout
-        if len(stdout) > 5000:
-            stdout = stdout[:2500] + "\n\n... [truncated] ...\n\n" + stdout[-2500:]
-        prompt_parts.append(stdout)
-        prompt_parts.append("```\n")
-
-    if context.execution_result.stderr.strip():
-        prompt_parts.append("## Standard Error:")
-        prompt_parts.append("```")
-        # Truncate very long error output
-        stderr = context.execution_result.stderr
-        if len(stderr) > 5000:
-            stderr = stderr[:2500] + "\n\n... [truncated] ...\n\n" + stderr[-2500:]
-        prompt_parts.append(stderr)
-        prompt_parts.append("```\n")
-
-    # Script section
-    prompt_parts.append("# SCRIPT")
-    prompt_parts.append(f"File: {context.script_path}")
-    prompt_parts.append("```")
-    prompt_parts.append(context.script_content)
-    prompt_parts.append("```\n")
-
-    # Git context section
-    if context.git_context:
-        prompt_parts.append("# GIT CONTEXT")
-        prompt_parts.append(f"Branch: {context.git_context.branch}")
-        prompt_parts.append(f"Repository: {context.git_context.repo_root}\n")
-
-        if context.git_context.recent_commits:
-            prompt_parts.append("## Recent Commits:")
-            for i, commit in enumerate(context.git_context.recent_commits[:3], 1):
-                prompt_parts.append(f"{i}. {commit.hash[:8]} - {commit.message}")
-                prompt_parts.append(f"   by {commit.author} on {commit.date}")
-                if commit.diff and len(commit.diff) < 2000:
-                    # Only include compact diffs
-                    prompt_parts.append(f"   Changes:\n{commit.diff[:1000]}")
-            prompt_parts.append("")
-
-        if context.git_context.uncommitted_changes.strip():
-            prompt_parts.append("## Uncommitted Changes:")
-            prompt_parts.append("```diff")
-            # Truncate large diffs
-            changes = context.git_context.uncommitted_changes
-            if len(changes) > 3000:
-                changes = changes[:1500] + "\n\n... [truncated] ...\n\n" + changes[-1500:]
-            prompt_parts.append(changes)
-            prompt_parts.append("```\n")
-
-    # System section
-    prompt_parts.append("# SYSTEM INFORMATION")
-    prompt_parts.append(f"OS: {context.system_context.os_name}")
-    prompt_parts.append(f"OS Version: {context.system_context.os_version}")
-    prompt_parts.append(f"Python: {context.system_context.python_version.split()[0]}")
-    prompt_parts.append(f"Shell: {context.system_context.shell}")
-    prompt_parts.append(f"Working Directory: {context.system_context.cwd}\n")
-
-    # Success criteria (if defined)
-    if context.config.scripts:
-        script_configs = [
-            s for s in context.config.scripts
-            if s.path.name == context.script_path.name
-        ]
-        if script_configs and script_configs[0].success_criteria:
-            prompt_parts.append("# SUCCESS CRITERIA")
-            criteria = script_configs[0].success_criteria
-            for key, value in criteria.items():
-                prompt_parts.append(f"- {key}: {value}")
-            prompt_parts.append("")
-
-    # Custom prompt section (if provided)
-    if context.config.scripts:
-        script_configs = [
-            s for s in context.config.scripts
-            if s.path.name == context.script_path.name
-        ]
-        if script_configs and script_configs[0].custom_prompt:
-            prompt_parts.append("# ADDITIONAL CONTEXT")
-            prompt_parts.append(script_configs[0].custom_prompt)
-            prompt_parts.append("")
+    _write_common_sections(buf, context, script_config)
 
     # Instructions section for diagnosis
-    prompt_parts.append("# INSTRUCTIONS")
-    prompt_parts.append(
-        "Please provide a detailed diagnosis including:\n"
-        "1. What is the root cause of the error?\n"
-        "2. Why is this error happening?\n"
-        "3. What would need to be changed to fix it?\n"
-        "4. Are there any related issues or concerns?\n"
-        "5. What is the recommended approach to fix this?\n\n"
-        "Remember: This is DIAGNOSIS ONLY - do not modify any files.\n"
-        "Explain what's wrong in clear, actionable terms."
-    )
+    buf.write(_DIAGNOSIS_INSTRUCTIONS)
 
-    return "\n".join(prompt_parts)
+    return buf.getvalue()
 
 
 def build_retry_prompt(
@@ -360,25 +206,249 @@ def build_retry_prompt(
     Returns:
         Formatted retry prompt string
     """
-    base_prompt = build_healing_prompt(context)
-
     # Add retry context
-    retry_section = [
-        f"\n# RETRY ATTEMPT {attempt_number}",
-        "Previous healing attempt did not succeed.",
-        "",
-        "## Previous Attempt Output:",
-        "```",
-        previous_attempt_output[:2000],  # Truncate if too long
-        "```",
-        "",
-        "Please try a different approach to fix this issue.",
-        "Review what might have been missed in the previous attempt.",
-    ]
+    retry_section = "".join(
+        (
+            f"\n# RETRY ATTEMPT {attempt_number}\n",
+            "Previous healing attempt did not succeed.\n\n",
+            "## Previous Attempt Output:\n",
+            "```\n",
+            previous_attempt_output[:2000],  # Truncate if too long
+            "\n```\n\n",
+            "Please try a different approach to fix this issue.\n",
+            "Review what might have been missed in the previous attempt.\n\n",
+        )
+    )
 
     # Insert retry section before instructions
-    if "# INSTRUCTIONS" in base_prompt:
-        parts = base_prompt.split("# INSTRUCTIONS")
-        return parts[0] + "\n".join(retry_section) + "\n\n# INSTRUCTIONS" + parts[1]
-    else:
-        return base_prompt + "\n" + "\n".join(retry_section)
+    return build_healing_prompt(context, extra_section=retry_section)
+
+
+def _find_script_config(context: HealingContext) -> ScriptConfig | None:
+    """Find the configuration entry for the script being healed.
+
+    Args:
+        context: Healing context with configuration
+
+    Returns:
+        First script config whose file name matches the script, or None
+    """
+    script_name = context.script_path.name
+    return next(
+        (s for s in context.config.scripts if s.path.name == script_name),
+        None,
+    )
+
+
+def _write_common_sections(
+    buf: io.StringIO,
+    context: HealingContext,
+    script_config: ScriptConfig | None,
+) -> None:
+    """Write the sections shared by healing and diagnosis prompts.
+
+    Covers the script description, error, script, git and system
+    information, success criteria and any custom prompt.
+
+    Args:
+        buf: Buffer the prompt is written to
+        context: Complete healing context
+        script_config: Configuration entry for the script, if any
+    """
+    if script_config and script_config.description:
+        buf.write(f"Description: {script_config.description}\n\n")
+
+    output_limit, diff_limit = _truncation_limits(context)
+    git_context = context.git_context
+    _write_error_section(buf, context.execution_result, output_limit)
+    _write_script_section(buf, context.script_path, context.script_content)
+    if git_context:
+        _write_git_section(buf, git_context, diff_limit)
+    _write_system_section(buf, context.system_context)
+
+    # Success criteria (if defined)
+    if script_config and script_config.success_criteria:
+        buf.write("# SUCCESS CRITERIA\n")
+        criteria = script_config.success_criteria.items()
+        buf.write("".join(f"- {key}: {value}\n" for key, value in criteria))
+        buf.write("\n")
+
+    # Custom prompt section (if provided)
+    if script_config and script_config.custom_prompt:
+        buf.write("# ADDITIONAL CONTEXT\n")
+        buf.write(script_config.custom_prompt)
+        buf.write("\n\n")
+
+
+def _write_error_section(
+    buf: io.StringIO, result: ExecutionResult, output_limit: int
+) -> None:
+    """Write the exit code, timing and captured output of the failed run.
+
+    Args:
+        buf: Buffer the prompt is written to
+        result: Execution result of the failed run
+        output_limit: Maximum characters kept from stdout and from stderr
+    """
+    buf.write(
+        _ERROR_TEMPLATE.format_map(
+            {
+                "exit_code": result.exit_code,
+                "duration": result.duration,
+                "timestamp": result.timestamp_iso,
+            }
+        )
+    )
+
+    if result.stdout and not result.stdout.isspace():
+        buf.write("## Standard Output:\n")
+        buf.write("```\n")
+        # Truncate very long output
+        buf.write(_truncate_middle(result.stdout, output_limit))
+        buf.write("\n```\n\n")
+
+    if result.stderr and not result.stderr.isspace():
+        buf.write("## Standard Error:\n")
+        buf.write("```\n")
+        # Truncate very long error output
+        buf.write(_truncate_middle(result.stderr, output_limit))
+        buf.write("\n```\n\n")
+
+
+def _write_script_section(buf: io.StringIO, path: Path, content: str) -> None:
+    """Write the script being healed.
+
+    Args:
+        buf: Buffer the prompt is written to
+        path: Path to the script
+        content: Content of the script
+    """
+    buf.write(_SCRIPT_TEMPLATE.format_map({"path": path, "content": content}))
+
+
+def _write_git_section(
+    buf: io.StringIO, git_context: GitContext, diff_limit: int
+) -> None:
+    """Write the branch, recent commits and uncommitted changes.
+
+    Args:
+        buf: Buffer the prompt is written to
+        git_context: Git repository state
+        diff_limit: Maximum characters kept from uncommitted changes
+    """
+    buf.write("# GIT CONTEXT\n")
+    buf.write(f"Branch: {git_context.branch}\n")
+    buf.write(f"Repository: {git_context.repo_root}\n\n")
+
+    recent_commits = git_context.recent_commits
+    if recent_commits:
+        buf.write("## Recent Commits:\n")
+        for i, commit in enumerate(islice(recent_commits, 3), 1):
+            buf.write(
+                _COMMIT_TEMPLATE.format_map(
+                    {
+                        "number": i,
+                        "hash": commit.hash[:8],
+                        "message": commit.message,
+                        "author": commit.author,
+                        "date": commit.date,
+                    }
+                )
+            )
+            diff = commit.diff
+            if diff and len(diff) < 2000:
+                # Only include compact diffs
+                buf.write(_COMMIT_DIFF_TEMPLATE.format_map({"diff": diff[:1000]}))
+        buf.write("\n")
+
+    changes = git_context.uncommitted_changes
+    if changes and not changes.isspace():
+        buf.write("## Uncommitted Changes:\n")
+        buf.write("```diff\n")
+        # Truncate large diffs
+        buf.write(_truncate_middle(changes, diff_limit))
+        buf.write("\n```\n\n")
+
+
+def _write_system_section(buf: io.StringIO, system_context: SystemContext) -> None:
+    """Write the operating system, Python and shell details.
+
+    Args:
+        buf: Buffer the prompt is written to
+        system_context: System information
+    """
+    buf.write(
+        _SYSTEM_TEMPLATE.format_map(
+            {
+                "os_name": system_context.os_name,
+                "os_version": system_context.os_version,
+                "python_version": system_context.python_version_short,
+                "shell": system_context.shell,
+                "cwd": system_context.cwd,
+            }
+        )
+    )
+
+
+def _format_attempt(attempt: PreviousAttempt) -> str:
+    """Render one previous healing attempt.
+
+    Args:
+        attempt: Previous attempt that did not fix the script
+
+    Returns:
+        Attempt section, with a very long error truncated in the middle
+    """
+    files = ""
+    if attempt.changes_made:
+        files = "Files modified:\n" + "".join(
+            "  - " + file + "\n" for file in attempt.changes_made
+        )
+
+    return _ATTEMPT_TEMPLATE.format_map(
+        {
+            "number": attempt.attempt_number,
+            "summary": attempt.claude_response_summary,
+            "files": files,
+            # Truncate very long errors
+            "error": _truncate_middle(attempt.error_after, 1000, _SHORT_TRUNCATION_MARKER),
+        }
+    )
+
+
+def _truncation_limits(context: HealingContext) -> tuple[int, int]:
+    """Choose how much command output and diff to keep in the prompt.
+
+    Args:
+        context: Complete healing context
+
+    Returns:
+        Tuple of (output limit, uncommitted diff limit) in characters
+    """
+    result = context.execution_result
+    git_context = context.git_context
+    input_size = len(context.script_content) + len(result.stdout) + len(result.stderr)
+    if git_context:
+        input_size += len(git_context.uncommitted_changes)
+
+    if input_size > _MAX_INPUT_SIZE:
+        return _COMPACT_OUTPUT_LIMIT, _COMPACT_DIFF_LIMIT
+    return _OUTPUT_LIMIT, _DIFF_LIMIT
+
+
+def _truncate_middle(text: str, limit: int, marker: str = _TRUNCATION_MARKER) -> str:
+    """Cut the middle out of text longer than a limit.
+
+    Args:
+        text: Text to truncate
+        limit: Maximum length kept before truncating
+        marker: Text inserted where the middle was removed
+
+    Returns:
+        The text unchanged if within the limit, otherwise its first and last
+        limit // 2 characters joined by the marker
+    """
+    if len(text) <= limit:
+        return text
+    half = limit // 2
+    return "".join((text[:half], marker, text[-half:]))
@@ -6,25 +6,25 @@ script system with rich terminal output, progress bars, and tables.
 
 from __future__ import annotations
 
-import json
+import os
 import shutil
-import sys
-from datetime import datetime
+import tempfile
+from contextlib import contextmanager
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import typer
 from rich.console import Console
 from rich.panel import Panel
-from rich.progress import Progress, SpinnerColumn, TextColumn
-from rich.table import Table
+from rich.text import Text
 
-from lazarus.claude.client import ClaudeCodeClient
-from lazarus.config.loader import ConfigError, load_config, validate_config_file
-from lazarus.core.context import build_context
-from lazarus.core.healer import Healer
-from lazarus.core.runner import ScriptRunner
-from lazarus.logging.history import HealingHistory, HistoryRecord
-from lazarus.logging.logger import LazarusLogger
+# Healing machinery (pydantic config schema, Claude client, git helpers) and
+# the heavier Rich renderers (progress, table) are imported inside the commands
+# that use them, so --help, init and check start fast
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from lazarus.logging.history import HistoryRecord
 
 # Create Typer app
 app = typer.Typer(
@@ -101,6 +101,11 @@ def heal(
         lazarus heal scripts/backup.py
         lazarus heal scripts/deploy.sh --max-attempts 5 --verbose
     """
+    from lazarus.config.loader import ConfigError, load_config
+    from lazarus.core.healer import Healer
+    from lazarus.logging.history import HealingHistory
+    from lazarus.logging.logger import LazarusLogger
+
     try:
         # Load configuration
         config = load_config(config_path)
@@ -138,10 +143,13 @@ def heal(
         # Show healing banner
         console.print(
             Panel.fit(
-                f"[bold blue]Lazarus Self-Healing System[/bold blue]\n"
-                f"Script: {script_path}\n"
-                f"Max attempts: {config.healing.max_attempts}\n"
-                f"Total timeout: {config.healing.total_timeout}s",
+                _banner(
+                    "Lazarus Self-Healing System",
+                    "blue",
+                    f"Script: {script_path}",
+                    f"Max attempts: {config.healing.max_attempts}",
+                    f"Total timeout: {config.healing.total_timeout}s",
+                ),
                 border_style="blue",
             )
         )
@@ -154,17 +162,9 @@ def heal(
         )
 
         # Run healing with progress
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console,
-        ) as progress:
-            task = progress.add_task("Running healing process...", total=None)
-
+        with _spinner("Running healing process..."):
             result = healer.heal(script_path)
 
-            progress.remove_task(task)
-
         # Log healing completion
         logger.log_healing_complete(script_path=script_path, result=result)
 
@@ -177,19 +177,21 @@ def heal(
         _display_healing_result(result, verbose=verbose)
 
         # Exit with appropriate code
-        sys.exit(0 if result.success else 1)
+        raise typer.Exit(0 if result.success else 1)
 
     except ConfigError as e:
         console.print(f"[red]Configuration error:[/red] {e}")
-        sys.exit(2)
+        raise typer.Exit(2) from e
     except FileNotFoundError as e:
         console.print(f"[red]File not found:[/red] {e}")
-        sys.exit(2)
+        raise typer.Exit(2) from e
+    except typer.Exit:
+        raise
     except Exception as e:
         console.print(f"[red]Unexpected error:[/red] {e}")
         if verbose:
             console.print_exception()
-        sys.exit(3)
+        raise typer.Exit(3) from e
 
 
 @app.command()
@@ -289,6 +291,10 @@ def history(
         lazarus history --limit 20 --script backup.py
         lazarus history --json > history.json
     """
+    import json
+
+    from lazarus.logging.history import HealingHistory
+
     try:
         # Initialize history manager
         # First try to find existing history directory in parent directories
@@ -304,21 +310,23 @@ def history(
 
         if not records:
             console.print("[yellow]No healing history found[/yellow]")
-            sys.exit(0)
+            raise typer.Exit()
 
         # JSON output
         if json_output:
             output = json.dumps([record.to_dict() for record in records], indent=2)
             console.print(output)
-            sys.exit(0)
+            raise typer.Exit()
 
         # Display as rich table
         _display_history_table(records)
-        sys.exit(0)
+        raise typer.Exit()
 
+    except typer.Exit:
+        raise
     except Exception as e:
         console.print(f"[red]Error retrieving history:[/red] {e}")
-        sys.exit(1)
+        raise typer.Exit(1) from e
 
 
 @app.command()
@@ -346,11 +354,11 @@ def validate(
         lazarus validate
         lazarus validate config/lazarus.yaml --verbose
     """
+    from lazarus.config.loader import find_config_file, validate_config_file
+
     try:
         # If no path provided, search for config
         if config_path is None:
-            from lazarus.config.loader import find_config_file
-
             config_path = find_config_file()
             if config_path is None:
                 console.print(
@@ -359,7 +367,7 @@ def validate(
                 console.print(
                     "\nRun [bold]lazarus init[/bold] to create a configuration file."
                 )
-                sys.exit(1)
+                raise typer.Exit(1)
 
         # Validate the configuration
         is_valid, errors = validate_config_file(config_path)
@@ -367,30 +375,30 @@ def validate(
         if is_valid:
             console.print(
                 Panel.fit(
-                    f"[bold green]Configuration is valid![/bold green]\n"
-                    f"File: {config_path}",
+                    _banner("Configuration is valid!", "green", f"File: {config_path}"),
                     border_style="green",
                 )
             )
-            sys.exit(0)
+            raise typer.Exit()
         else:
             console.print(
                 Panel.fit(
-                    f"[bold red]Configuration validation failed[/bold red]\n"
-                    f"File: {config_path}",
+                    _banner("Configuration validation failed", "red", f"File: {config_path}"),
                     border_style="red",
                 )
             )
             console.print("\n[bold]Errors:[/bold]")
             for error in errors:
                 console.print(f"  [red]•[/red] {error}")
-            sys.exit(1)
+            raise typer.Exit(1)
 
+    except typer.Exit:
+        raise
     except Exception as e:
         console.print(f"[red]Error validating configuration:[/red] {e}")
         if verbose:
             console.print_exception()
-        sys.exit(2)
+        raise typer.Exit(2) from e
 
 
 @app.command()
@@ -427,31 +435,54 @@ def init(
     if output is None:
         output = Path.cwd() / "lazarus.yaml"
 
-    # Check if file exists
-    if output.exists() and not force:
+    # Check if file exists (lexists also refuses to write through a dangling symlink)
+    if os.path.lexists(output) and not force:
         console.print(f"[red]File already exists:[/red] {output}")
         console.print("Use --force to overwrite")
-        sys.exit(1)
+        raise typer.Exit(1)
 
     # Create template
     template = _create_config_template(full=full)
 
-    # Write to file
+    # Write to a temporary file next to the target and rename it into place,
+    # so an interrupted --force never leaves a half-written config behind.
+    # The temporary name is unique, so it cannot clobber a user's file or
+    # collide with a concurrent init
     try:
-        output.write_text(template)
+        fd, tmp_name = tempfile.mkstemp(
+            dir=output.parent, prefix=f".{output.name}.", suffix=".tmp"
+        )
+        try:
+            with os.fdopen(fd, "w") as tmp_file:
+                tmp_file.write(template)
+            # mkstemp creates the file private to the user; give the config
+            # the permissions a plain write would have
+            umask = os.umask(0)
+            os.umask(umask)
+            os.chmod(tmp_name, 0o666 & ~umask)
+            os.replace(tmp_name, output)
+        except OSError:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
         console.print(
             Panel.fit(
-                f"[bold green]Configuration created![/bold green]\n"
-                f"File: {output}\n\n"
-                f"Edit this file to configure your scripts and settings.\n"
-                f"Run [bold]lazarus validate[/bold] to check your configuration.",
+                _banner(
+                    "Configuration created!",
+                    "green",
+                    f"File: {output}",
+                    "",
+                    "Edit this file to configure your scripts and settings.",
+                    Text.assemble(
+                        "Run ", ("lazarus validate", "bold"), " to check your configuration."
+                    ),
+                ),
                 border_style="green",
             )
         )
-        sys.exit(0)
+        raise typer.Exit()
     except OSError as e:
         console.print(f"[red]Failed to write configuration:[/red] {e}")
-        sys.exit(2)
+        raise typer.Exit(2) from e
 
 
 @app.command()
@@ -486,6 +517,11 @@ def diagnose(
         lazarus diagnose scripts/backup.py
         lazarus diagnose broken.py --verbose
     """
+    from lazarus.claude.client import ClaudeCodeClient
+    from lazarus.config.loader import ConfigError, load_config
+    from lazarus.core.context import build_context
+    from lazarus.core.runner import ScriptRunner
+
     try:
         # Load configuration
         config = load_config(config_path)
@@ -497,9 +533,12 @@ def diagnose(
         # Show diagnosis banner
         console.print(
             Panel.fit(
-                f"[bold blue]Lazarus Script Diagnosis[/bold blue]\n"
-                f"Script: {script_path}\n"
-                f"Mode: Analysis only (no changes)",
+                _banner(
+                    "Lazarus Script Diagnosis",
+                    "blue",
+                    f"Script: {script_path}",
+                    "Mode: Analysis only (no changes)",
+                ),
                 border_style="blue",
             )
         )
@@ -507,24 +546,20 @@ def diagnose(
         # Initialize script runner
         runner = ScriptRunner(config)
 
-        # Find script configuration
-        script_config = None
-        for sc in config.scripts:
-            if (
-                sc.path.name == script_path.name
-                or sc.path.resolve() == script_path.resolve()
-            ):
-                script_config = sc
-                break
+        # Find script configuration: match by file name first, and only fall
+        # back to resolving paths (a syscall per script) when no name matches
+        script_name = script_path.name
+        script_config = next(
+            (sc for sc in config.scripts if sc.path.name == script_name), None
+        )
+        if script_config is None:
+            resolved = script_path.resolve()
+            script_config = next(
+                (sc for sc in config.scripts if sc.path.resolve() == resolved), None
+            )
 
         # Run the script to capture the error
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console,
-        ) as progress:
-            task = progress.add_task("Running script to capture error...", total=None)
-
+        with _spinner("Running script to capture error..."):
             timeout = script_config.timeout if script_config else 300
             working_dir = script_config.working_dir if script_config else None
 
@@ -534,18 +569,15 @@ def diagnose(
                 timeout=timeout,
             )
 
-            progress.remove_task(task)
-
         # Check if script succeeded
         if execution_result.success:
             console.print(
                 Panel.fit(
-                    "[bold green]Script executed successfully![/bold green]\n"
-                    "No errors to diagnose.",
+                    _banner("Script executed successfully!", "green", "No errors to diagnose."),
                     border_style="green",
                 )
             )
-            sys.exit(0)
+            raise typer.Exit()
 
         # Show the error
         if verbose:
@@ -584,29 +616,21 @@ def diagnose(
                 "Then authenticate with:\n"
                 "  claude login"
             )
-            sys.exit(2)
+            raise typer.Exit(2)
 
         # Request diagnosis from Claude
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console,
-        ) as progress:
-            task = progress.add_task("Requesting diagnosis from Claude Code...", total=None)
-
+        with _spinner("Requesting diagnosis from Claude Code..."):
             diagnosis = claude_client.request_diagnosis(context)
 
-            progress.remove_task(task)
-
         # Display the diagnosis
         if diagnosis.success or diagnosis.explanation:
             console.print(
                 Panel.fit(
-                    "[bold cyan]Claude's Diagnosis[/bold cyan]",
+                    _banner("Claude's Diagnosis", "cyan"),
                     border_style="cyan",
                 )
             )
-            console.print(diagnosis.explanation or diagnosis.raw_output)
+            console.print(diagnosis.explanation or diagnosis.response_text)
 
             if verbose and diagnosis.raw_output:
                 console.print("\n[dim]--- Raw Output ---[/dim]")
@@ -614,29 +638,34 @@ def diagnose(
         else:
             console.print(
                 Panel.fit(
-                    f"[bold red]Diagnosis Failed[/bold red]\n"
-                    f"Error: {diagnosis.error_message or 'Unknown error'}",
+                    _banner(
+                        "Diagnosis Failed",
+                        "red",
+                        f"Error: {diagnosis.error_message or 'Unknown error'}",
+                    ),
                     border_style="red",
                 )
             )
             if verbose and diagnosis.raw_output:
                 console.print("\n[dim]--- Raw Output ---[/dim]")
                 console.print(diagnosis.raw_output)
-            sys.exit(1)
+            raise typer.Exit(1)
 
-        sys.exit(0)
+        raise typer.Exit()
 
     except ConfigError as e:
         console.print(f"[red]Configuration error:[/red] {e}")
-        sys.exit(2)
+        raise typer.Exit(2) from e
     except FileNotFoundError as e:
         console.print(f"[red]File not found:[/red] {e}")
-        sys.exit(2)
+        raise typer.Exit(2) from e
+    except typer.Exit:
+        raise
     except Exception as e:
         console.print(f"[red]Unexpected error:[/red] {e}")
         if verbose:
             console.print_exception()
-        sys.exit(3)
+        raise typer.Exit(3) from e
 
 
 @app.command()
@@ -659,9 +688,11 @@ def check(
         lazarus check
         lazarus check --verbose
     """
+    from rich.table import Table
+
     console.print(
         Panel.fit(
-            "[bold blue]Checking Lazarus Prerequisites[/bold blue]",
+            _banner("Checking Lazarus Prerequisites", "blue"),
             border_style="blue",
         )
     )
@@ -717,10 +748,84 @@ def check(
                     "  Then authenticate: claude login"
                 )
 
-        sys.exit(1)
+        raise typer.Exit(1)
     else:
         console.print("\n[bold green]All prerequisites are available![/bold green]")
-        sys.exit(0)
+        raise typer.Exit()
+
+
+def _banner(title: str, color: str, *lines: str | Text) -> Text:
+    """Build panel content with a bold colored title line.
+
+    Content is assembled as Rich Text rather than markup strings, so it is not
+    run through the markup parser and brackets in paths or error messages are
+    shown literally.
+
+    Args:
+        title: Title shown on the first line
+        color: Color of the title
+        *lines: Plain lines shown below the title
+
+    Returns:
+        Text renderable for use in a Panel
+    """
+    text = Text()
+    text.append(title, style=f"bold {color}")
+    for line in lines:
+        text.append("\n")
+        text.append(line)
+    return text
+
+
+@contextmanager
+def _spinner(description: str) -> Iterator[None]:
+    """Show a spinner while the block runs.
+
+    When output is not a terminal (CI, pipes) a single plain line is printed
+    instead, so no spinner thread or redraws are started and rich.progress is
+    never imported.
+
+    Args:
+        description: Text shown next to the spinner
+    """
+    if not console.is_terminal:
+        console.print(f"[dim]{description}[/dim]")
+        yield
+        return
+
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+
+    with Progress(
+        SpinnerColumn(),
+        TextColumn("[progress.description]{task.description}"),
+        console=console,
+    ) as progress:
+        task = progress.add_task(description, total=None)
+        yield
+        progress.remove_task(task)
+
+
+def _format_history_timestamp(timestamp: str) -> str:
+    """Format an ISO 8601 history timestamp as ``YYYY-MM-DD HH:MM``.
+
+    History records store ``datetime.isoformat()`` output, so the common case
+    is handled by slicing; anything else goes through ``fromisoformat``.
+
+    Args:
+        timestamp: Timestamp string from a history record
+
+    Returns:
+        Timestamp formatted to minute precision
+    """
+    if len(timestamp) >= 16 and timestamp[10] == "T" and timestamp[13] == ":":
+        return f"{timestamp[:10]} {timestamp[11:16]}"
+
+    from datetime import datetime
+
+    try:
+        return datetime.fromisoformat(timestamp).strftime("%Y-%m-%d %H:%M")
+    except ValueError:
+        return timestamp[:16]
 
 
 def _display_history_table(records: list[HistoryRecord]) -> None:
@@ -729,6 +834,8 @@ def _display_history_table(records: list[HistoryRecord]) -> None:
     Args:
         records: List of HistoryRecord objects to display
     """
+    from rich.table import Table
+
     table = Table(title="Healing History", show_header=True, header_style="bold cyan")
     table.add_column("Timestamp", style="dim")
     table.add_column("Script", style="cyan")
@@ -737,34 +844,21 @@ def _display_history_table(records: list[HistoryRecord]) -> None:
     table.add_column("Duration", justify="right")
     table.add_column("PR URL", style="blue")
 
-    for record in records:
-        # Format timestamp
-        try:
-            dt = datetime.fromisoformat(record.timestamp)
-            timestamp = dt.strftime("%Y-%m-%d %H:%M")
-        except ValueError:
-            timestamp = record.timestamp[:16]
-
-        # Format status
-        status = "[green]Success[/green]" if record.success else "[red]Failed[/red]"
-
-        # Format script path (show only filename)
-        script_name = Path(record.script_path).name
-
-        # Format duration
-        duration = f"{record.duration:.1f}s"
-
-        # Format PR URL (show only if available)
-        pr_url = record.pr_url if record.pr_url else ""
-
-        table.add_row(
-            timestamp,
-            script_name,
-            status,
+    # Build every row up front; the script name is taken with os.path.basename
+    # rather than constructing a Path per record just to read .name
+    rows = [
+        (
+            _format_history_timestamp(record.timestamp),
+            os.path.basename(record.script_path),
+            "[green]Success[/green]" if record.success else "[red]Failed[/red]",
             str(record.attempts_count),
-            duration,
-            pr_url,
+            f"{record.duration:.1f}s",
+            record.pr_url or "",
         )
+        for record in records
+    ]
+    for row in rows:
+        table.add_row(*row)
 
     console.print(table)
 
@@ -780,9 +874,12 @@ def _display_healing_result(result, verbose: bool = False) -> None:
         # Success panel
         console.print(
             Panel.fit(
-                f"[bold green]Healing Successful![/bold green]\n"
-                f"Attempts: {len(result.attempts)}\n"
-                f"Duration: {result.duration:.2f}s",
+                _banner(
+                    "Healing Successful!",
+                    "green",
+                    f"Attempts: {len(result.attempts)}",
+                    f"Duration: {result.duration:.2f}s",
+                ),
                 border_style="green",
             )
         )
@@ -790,27 +887,40 @@ def _display_healing_result(result, verbose: bool = False) -> None:
         # Failure panel
         console.print(
             Panel.fit(
-                f"[bold red]Healing Failed[/bold red]\n"
-                f"Attempts: {len(result.attempts)}\n"
-                f"Duration: {result.duration:.2f}s\n"
-                f"Error: {result.error_message or 'Unknown'}",
+                _banner(
+                    "Healing Failed",
+                    "red",
+                    f"Attempts: {len(result.attempts)}",
+                    f"Duration: {result.duration:.2f}s",
+                    f"Error: {result.error_message or 'Unknown'}",
+                ),
                 border_style="red",
             )
         )
 
     # Show attempts in verbose mode
     if verbose and result.attempts:
-        console.print("\n[bold]Healing Attempts:[/bold]")
+        from rich.table import Table
+
+        # One table for all attempts; Claude's text goes in as plain Text so
+        # brackets in its explanation are not parsed as markup
+        table = Table(title="Healing Attempts", show_header=True, header_style="bold")
+        table.add_column("Attempt", style="cyan", justify="right")
+        table.add_column("Duration", justify="right")
+        table.add_column("Status")
+        table.add_column("Claude")
+        table.add_column("Files changed")
+
         for attempt in result.attempts:
-            console.print(
-                f"\n[cyan]Attempt {attempt.attempt_number}:[/cyan] "
-                f"({attempt.duration:.2f}s)"
+            table.add_row(
+                str(attempt.attempt_number),
+                f"{attempt.duration:.2f}s",
+                attempt.verification.status,
+                Text(attempt.claude_response.explanation or ""),
+                Text(", ".join(attempt.claude_response.files_changed)),
             )
-            if attempt.claude_response.explanation:
-                console.print(f"  Claude: {attempt.claude_response.explanation}")
-            console.print(f"  Status: {attempt.verification.status}")
-            if attempt.claude_response.files_changed:
-                console.print(f"  Files changed: {', '.join(attempt.claude_response.files_changed)}")
+
+        console.print(table)
 
 
 def _show_config_summary(config) -> None:
@@ -831,99 +941,21 @@ def _show_config_summary(config) -> None:
 def _create_config_template(full: bool = False) -> str:
     """Create configuration template.
 
+    The templates ship as package data in ``lazarus/config/templates``.
+
     Args:
         full: Whether to create full template with all options
 
     Returns:
         YAML configuration template as string
     """
-    if full:
-        # Full template with all options
-        return """# Lazarus Self-Healing Configuration
-# Full template with all available options
-
-scripts:
-  - name: example-script
-    path: scripts/example.py
-    description: Example script that might fail
-    schedule: "0 */6 * * *"  # Every 6 hours
-    timeout: 300
-    working_dir: null
-    allowed_files:
-      - "scripts/**/*.py"
-      - "config/*.yaml"
-    forbidden_files:
-      - "secrets.yaml"
-      - ".env"
-    environment:
-      - DATABASE_URL
-      - API_KEY
-    setup_commands: []
-    custom_prompt: null
-    idempotent: true
-    success_criteria:
-      exit_code: 0
-      contains: "Success"
-
-healing:
-  max_attempts: 3
-  timeout_per_attempt: 300
-  total_timeout: 900
-  claude_model: claude-sonnet-4-5-20250929
-  max_turns: 30
-  allowed_tools: []
-  forbidden_tools: []
-
-notifications:
-  slack:
-    webhook_url: "${SLACK_WEBHOOK_URL}"
-    on_success: true
-    on_failure: true
-
-git:
-  create_pr: true
-  branch_prefix: lazarus/fix
-  draft_pr: false
-  auto_merge: false
-
-security:
-  additional_patterns: []
-  safe_env_vars:
-    - PATH
-    - HOME
-    - USER
-
-logging:
-  level: INFO
-  console: true
-  file: logs/lazarus.log
-  rotation: 10
-  retention: 10
-"""
-    else:
-        # Minimal template
-        return """# Lazarus Self-Healing Configuration
-# Minimal starter template
-
-scripts:
-  - name: my-script
-    path: scripts/example.py
-    description: My script that might fail
-    timeout: 300
-
-healing:
-  max_attempts: 3
-  timeout_per_attempt: 300
-  total_timeout: 900
-
-git:
-  create_pr: true
-  branch_prefix: lazarus/fix
-
-logging:
-  level: INFO
-  console: true
-"""
+    from importlib.resources import files
+
+    name = "full.yaml" if full else "minimal.yaml"
+    # Resolve relative to the top-level package so lazarus.config (and with it
+    # pydantic) is not imported just to read a text file
+    template = files("lazarus").joinpath("config", "templates", name)
+    return template.read_text(encoding="utf-8")
 
 
 if __name__ == "__main__":
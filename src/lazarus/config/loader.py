@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
+import hashlib
 import os
 import re
+import time
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
@@ -12,6 +15,14 @@ from pydantic import ValidationError
 
 from lazarus.config.schema import LazarusConfig
 
+# The config is plain data with no custom tags, so the libyaml-backed loader
+# is a drop-in replacement; PyYAML builds without libyaml fall back to the
+# pure-Python one.
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # pragma: no cover - depends on how PyYAML was built
+    from yaml import SafeLoader as _SafeLoader  # type: ignore[assignment]
+
 
 class ConfigError(Exception):
     """Configuration loading or validation error."""
@@ -19,10 +30,117 @@ class ConfigError(Exception):
     pass
 
 
+# A stat match is only trusted if the file was already this old when it was
+# parsed; a same-size rewrite within one mtime tick is otherwise invisible
+# (the "racy clean" problem git's index has), so recent files are re-read.
+_RACY_WINDOW_NS = 2_000_000_000
+
+
+@dataclass(frozen=True)
+class _CachedYaml:
+    """A parsed YAML document and the file state it was parsed from."""
+
+    mtime_ns: int
+    size: int
+    digest: bytes
+    document: Any
+    stat_trusted: bool
+
+
+# Parsed YAML documents keyed by resolved path. Environment expansion and
+# validation still run on every load, so changed environment variables and
+# CLI overrides never leak between calls; only reading and parsing the file
+# is skipped.
+_yaml_cache: dict[Path, _CachedYaml] = {}
+
+
+def clear_config_cache() -> None:
+    """Forget all cached configuration documents."""
+    _yaml_cache.clear()
+
+
+def _load_yaml(config_path: Path) -> Any:
+    """Read and parse a YAML file, reusing the result if the file is unchanged.
+
+    An unchanged mtime and size skips reading the file at all; otherwise the
+    bytes are read and the previous parse is still reused if their digest
+    matches. The returned document is shared between calls and must not be
+    mutated.
+
+    Args:
+        config_path: Path to the YAML file
+
+    Returns:
+        Parsed YAML document (None for an empty file)
+
+    Raises:
+        OSError: If the file cannot be read
+        yaml.YAMLError: If the file is not valid YAML
+    """
+    key = config_path.resolve()
+    st = key.stat()
+
+    cached = _yaml_cache.get(key)
+    if (
+        cached is not None
+        and cached.stat_trusted
+        and cached.mtime_ns == st.st_mtime_ns
+        and cached.size == st.st_size
+    ):
+        return cached.document
+
+    data = key.read_bytes()
+    digest = hashlib.blake2b(data, digest_size=16).digest()
+    if cached is not None and cached.digest == digest:
+        document = cached.document
+    else:
+        document = yaml.load(data, Loader=_SafeLoader)
+
+    _yaml_cache[key] = _CachedYaml(
+        mtime_ns=st.st_mtime_ns,
+        size=st.st_size,
+        digest=digest,
+        document=document,
+        stat_trusted=time.time_ns() - st.st_mtime_ns > _RACY_WINDOW_NS,
+    )
+    return document
+
+
+# Matches ${VAR_NAME} or ${VAR_NAME:-default}
+_ENV_VAR_PATTERN = re.compile(
+    r"\$\{(?P<name>[A-Za-z_][A-Za-z0-9_]*)(?::-(?P<default>[^}]*))?\}"
+)
+
+
+def _replace_env_var(match: re.Match[str]) -> str:
+    """Substitute one ${VAR_NAME} or ${VAR_NAME:-default} placeholder.
+
+    Args:
+        match: Match of _ENV_VAR_PATTERN
+
+    Returns:
+        The variable's value, the default if it is unset, or the original
+        placeholder if neither is available
+    """
+    # Get value from environment, or use default
+    value = os.environ.get(match["name"])
+    if value is not None:
+        return value
+    # Return the original placeholder if no (or an empty) default is given
+    # and the var is not set. This helps with debugging - user will see
+    # what's missing
+    return match["default"] or match[0]
+
+
 def expand_env_vars(data: Any) -> Any:
     """Recursively expand environment variables in configuration data.
 
-    Supports ${VAR_NAME} and ${VAR_NAME:-default} syntax.
+    Supports ${VAR_NAME} and ${VAR_NAME:-default} syntax. Nested dicts and
+    lists are walked with an explicit stack rather than by recursion, and
+    always copied rather than modified, since the input may be a parsed
+    document cached across loads. Only exact dict, list and str instances
+    (all YAML's safe loader produces) are expanded; subclasses are returned
+    unchanged.
 
     Args:
         data: Configuration data (dict, list, str, or other)
@@ -30,32 +148,45 @@ def expand_env_vars(data: Any) -> Any:
     Returns:
         Data with environment variables expanded
     """
-    if isinstance(data, dict):
-        return {key: expand_env_vars(value) for key, value in data.items()}
-    elif isinstance(data, list):
-        return [expand_env_vars(item) for item in data]
-    elif isinstance(data, str):
-        # Match ${VAR_NAME} or ${VAR_NAME:-default}
-        pattern = r"\$\{([A-Za-z_][A-Za-z0-9_]*)(:-([^}]*))?\}"
-
-        def replace_var(match: re.Match[str]) -> str:
-            var_name = match.group(1)
-            default_value = match.group(3) if match.group(3) is not None else ""
-
-            # Get value from environment, or use default
-            value = os.environ.get(var_name)
-            if value is None:
-                if default_value:
-                    return default_value
-                # Return the original placeholder if no default and var not found
-                # This helps with debugging - user will see what's missing
-                return match.group(0)
-            return value
-
-        return re.sub(pattern, replace_var, data)
-    else:
+    data_type = type(data)
+    if data_type is str:
+        return _ENV_VAR_PATTERN.sub(_replace_env_var, data) if "${" in data else data
+    if data_type is not dict and data_type is not list:
         return data
 
+    root: dict[Any, Any] | list[Any] = {} if data_type is dict else [None] * len(data)
+    # Copies made so far, keyed by id() of the source container. YAML aliases
+    # can share a container or make it contain itself, so a container seen
+    # again reuses its copy instead of being walked (forever) once more
+    copies: dict[int, Any] = {id(data): root}
+    # (source container, copy being filled in) pairs still to visit
+    stack: list[tuple[Any, Any]] = [(data, root)]
+    while stack:
+        source, target = stack.pop()
+        items = source.items() if type(source) is dict else enumerate(source)
+        for key, value in items:
+            # Exact type checks are a single pointer comparison each, cheaper
+            # than isinstance() on every node
+            value_type = type(value)
+            # Strings are by far the most common leaves, so test them first.
+            # Most have no placeholders, and a substring check is far cheaper
+            # than running the pattern over them
+            if value_type is str:
+                target[key] = (
+                    _ENV_VAR_PATTERN.sub(_replace_env_var, value) if "${" in value else value
+                )
+            elif value_type is dict or value_type is list:
+                child = copies.get(id(value))
+                if child is None:
+                    child = {} if value_type is dict else [None] * len(value)
+                    copies[id(value)] = child
+                    stack.append((value, child))
+                target[key] = child
+            else:
+                target[key] = value
+
+    return root
+
 
 def find_config_file(start_path: Path | None = None) -> Path | None:
     """Find lazarus.yaml in current directory or parent directories.
@@ -66,20 +197,20 @@ def find_config_file(start_path: Path | None = None) -> Path | None:
     Returns:
         Path to lazarus.yaml if found, None otherwise
     """
-    if start_path is None:
-        start_path = Path.cwd()
-
-    current = start_path.resolve()
+    # os.getcwd() is already free of symlinks, so the default case needs no
+    # resolve(); the walk itself works on plain strings to avoid building
+    # Path objects for every directory level
+    current = os.getcwd() if start_path is None else os.path.abspath(start_path)
 
     # Search up to root, checking for lazarus.yaml or lazarus.yml
     while True:
         for filename in ("lazarus.yaml", "lazarus.yml"):
-            config_path = current / filename
-            if config_path.is_file():
-                return config_path
+            config_path = os.path.join(current, filename)
+            if os.path.isfile(config_path):
+                return Path(config_path)
 
         # Stop at filesystem root
-        parent = current.parent
+        parent = os.path.dirname(current)
         if parent == current:
             break
         current = parent
@@ -111,16 +242,16 @@ def load_config(path: Path | str | None = None) -> LazarusConfig:
             )
     else:
         config_path = Path(path)
-        if not config_path.is_file():
-            raise ConfigError(
-                f"Configuration file not found: {config_path}\n"
-                f"Please ensure the file exists and is readable."
-            )
 
-    # Load YAML
+    # Load YAML. A missing file is reported from the read itself rather than
+    # checked up front, which would cost an extra stat on every load
     try:
-        with open(config_path, encoding="utf-8") as f:
-            raw_data = yaml.safe_load(f)
+        raw_data = _load_yaml(config_path)
+    except (FileNotFoundError, IsADirectoryError) as e:
+        raise ConfigError(
+            f"Configuration file not found: {config_path}\n"
+            f"Please ensure the file exists and is readable."
+        ) from e
     except yaml.YAMLError as e:
         # Parse YAML error to provide helpful message
         error_msg = str(e)
@@ -159,8 +290,10 @@ def load_config(path: Path | str | None = None) -> LazarusConfig:
         config = LazarusConfig.model_validate(expanded_data)
     except ValidationError as e:
         # Format validation errors nicely
+        # Only loc and msg are shown, so skip building docs URLs, context
+        # and input copies for every error
         error_messages = []
-        for error in e.errors():
+        for error in e.errors(include_url=False, include_context=False, include_input=False):
             location = " -> ".join(str(loc) for loc in error["loc"])
             msg = error["msg"]
             error_messages.append(f"  {location}: {msg}")
@@ -193,8 +326,7 @@ def load_config_dict(path: Path | str | None = None) -> dict[str, Any]:
         config_path = Path(path)
 
     try:
-        with open(config_path, encoding="utf-8") as f:
-            raw_data = yaml.safe_load(f)
+        raw_data = _load_yaml(config_path)
     except (yaml.YAMLError, OSError) as e:
         raise ConfigError(f"Failed to load {config_path}: {e}") from e
 
@@ -13,6 +13,7 @@ import subprocess
 import sys
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
+from functools import cached_property
 from pathlib import Path
 
 from lazarus.config.schema import LazarusConfig
@@ -40,6 +41,11 @@ class ExecutionResult:
         """Check if execution was successful."""
         return self.exit_code == 0
 
+    @cached_property
+    def timestamp_iso(self) -> str:
+        """ISO 8601 form of the timestamp, formatted once per result."""
+        return self.timestamp.isoformat()
+
 
 @dataclass
 class CommitInfo:
@@ -92,6 +98,11 @@ class SystemContext:
     shell: str
     cwd: Path
 
+    @cached_property
+    def python_version_short(self) -> str:
+        """Version number without the build details of sys.version."""
+        return self.python_version.partition(" ")[0]
+
 
 @dataclass
 class PreviousAttempt:
@@ -402,14 +402,17 @@ class Healer:
         Returns:
             ScriptConfig if found, None otherwise
         """
+        # Match by file name first; only resolve paths (a syscall per script)
+        # when no configured script has the same name
+        script_name = script_path.name
         for script_config in self.config.scripts:
-            # Match by name or by path
-            if (
-                script_config.path.name == script_path.name
-                or script_config.path.resolve() == script_path.resolve()
-            ):
+            if script_config.path.name == script_name:
                 return script_config
-        return None
+
+        resolved = script_path.resolve()
+        return next(
+            (sc for sc in self.config.scripts if sc.path.resolve() == resolved), None
+        )
 
     def _has_uncommitted_changes(self, script_path: Path) -> bool:
         """Check if there are uncommitted changes to the script.
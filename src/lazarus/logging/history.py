@@ -7,10 +7,13 @@ attempts and their outcomes.
 
 from __future__ import annotations
 
+import heapq
 import json
 import uuid
+from collections.abc import Iterator
 from dataclasses import dataclass
 from datetime import UTC, datetime
+from operator import attrgetter
 from pathlib import Path
 from typing import Any
 
@@ -184,6 +187,44 @@ class HealingHistory:
 
         return record_id
 
+    def iter_history(self, script_filter: str | None = None) -> Iterator[HistoryRecord]:
+        """Lazily load healing history records from disk.
+
+        Record files are parsed one at a time as the iterator is consumed, in
+        directory order. Invalid record files are skipped.
+
+        Args:
+            script_filter: Optional script name or path to filter by
+
+        Yields:
+            HistoryRecord objects matching the filter, in no particular order
+
+        Example:
+            >>> history = HealingHistory()
+            >>> failures = [r for r in history.iter_history() if not r.success]
+        """
+        script_filter = script_filter.lower() if script_filter else None
+
+        for record_file in self.history_dir.glob("*.json"):
+            try:
+                data = json.loads(record_file.read_text())
+                record = HistoryRecord.from_dict(data)
+            except (json.JSONDecodeError, KeyError, ValueError):
+                # Skip invalid record files
+                continue
+
+            # Apply script filter if specified
+            if script_filter:
+                # Match by filename or full path
+                script_path = Path(record.script_path)
+                if (
+                    script_filter not in script_path.name.lower()
+                    and script_filter not in str(script_path).lower()
+                ):
+                    continue
+
+            yield record
+
     def get_history(
         self,
         limit: int = 10,
@@ -191,6 +232,9 @@ class HealingHistory:
     ) -> list[HistoryRecord]:
         """Get healing history records.
 
+        Only the ``limit`` newest records are kept while scanning, so memory
+        stays bounded however many sessions have been recorded.
+
         Args:
             limit: Maximum number of records to return (default: 10)
             script_filter: Optional script name or path to filter by
@@ -204,36 +248,11 @@ class HealingHistory:
             >>> for record in recent:
             ...     print(f"{record.timestamp}: {record.script_path}")
         """
-        # Get all JSON files in history directory
-        record_files = list(self.history_dir.glob("*.json"))
-
-        # Load records
-        records: list[HistoryRecord] = []
-        for record_file in record_files:
-            try:
-                data = json.loads(record_file.read_text())
-                record = HistoryRecord.from_dict(data)
-
-                # Apply script filter if specified
-                if script_filter:
-                    # Match by filename or full path
-                    script_path = Path(record.script_path)
-                    if (
-                        script_filter.lower() not in script_path.name.lower()
-                        and script_filter.lower() not in str(script_path).lower()
-                    ):
-                        continue
-
-                records.append(record)
-            except (json.JSONDecodeError, KeyError, ValueError):
-                # Skip invalid record files
-                continue
-
-        # Sort by timestamp (newest first)
-        records.sort(key=lambda r: r.timestamp, reverse=True)
-
-        # Apply limit
-        return records[:limit]
+        return heapq.nlargest(
+            limit,
+            self.iter_history(script_filter=script_filter),
+            key=attrgetter("timestamp"),
+        )
 
     def get_record(self, record_id: str) -> HistoryRecord | None:
         """Get a specific healing history record by ID.
@@ -6,6 +6,7 @@ and e2e tests.
 
 from __future__ import annotations
 
+import os
 from datetime import UTC, datetime
 from pathlib import Path
 from unittest.mock import Mock, patch
@@ -374,7 +375,6 @@ def reset_environment():
     a clean environment.
     """
     # Store original environment
-    import os
     original_env = os.environ.copy()
 
     yield
@@ -123,6 +123,22 @@ class TestInitCommand:
         content = config_file.read_text()
         assert "existing content" not in content
         assert "scripts:" in content
+        assert list(tmp_path.iterdir()) == [config_file]
+
+    def test_init_failed_write_keeps_existing_file(self, tmp_path):
+        """Test a failed --force write leaves the existing config untouched."""
+        config_file = tmp_path / "lazarus.yaml"
+        config_file.write_text("existing content")
+
+        with patch("os.replace", side_effect=OSError("disk full")):
+            result = runner.invoke(
+                app,
+                ["init", "--force", "--output", str(config_file)],
+            )
+
+        assert result.exit_code == 2
+        assert config_file.read_text() == "existing content"
+        assert list(tmp_path.iterdir()) == [config_file]
 
 
 class TestValidateCommand:
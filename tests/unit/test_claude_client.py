@@ -2,10 +2,13 @@
 
 from __future__ import annotations
 
+import asyncio
+import dataclasses
+import json
 import subprocess
 from datetime import UTC, datetime
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -62,6 +65,15 @@ def test_client_initialization_invalid_dir():
         ClaudeCodeClient(working_dir=Path("/nonexistent/path"))
 
 
+def test_client_initialization_not_a_directory(temp_working_dir):
+    """Test client initialization with a file instead of a directory."""
+    file_path = temp_working_dir / "script.py"
+    file_path.write_text("")
+
+    with pytest.raises(ValueError, match="not a directory"):
+        ClaudeCodeClient(working_dir=file_path)
+
+
 def test_is_available():
     """Test checking if Claude CLI is available."""
     client = ClaudeCodeClient(working_dir=Path.cwd(), timeout=300)
@@ -74,38 +86,69 @@ def test_is_available():
 @patch("shutil.which")
 def test_is_available_mocked(mock_which, temp_working_dir):
     """Test checking availability with mocked which."""
-    client = ClaudeCodeClient(working_dir=temp_working_dir, timeout=300)
-
     # Test when claude is available
     mock_which.return_value = "/usr/local/bin/claude"
+    client = ClaudeCodeClient(working_dir=temp_working_dir, timeout=300)
     assert client.is_available()
 
     # Test when claude is not available
     mock_which.return_value = None
+    client = ClaudeCodeClient(working_dir=temp_working_dir, timeout=300)
     assert not client.is_available()
 
 
+@patch("shutil.which")
+def test_is_available_cached(mock_which, temp_working_dir, monkeypatch):
+    """Test that the claude lookup is cached until PATH changes."""
+    mock_which.return_value = "/usr/local/bin/claude"
+    client = ClaudeCodeClient(working_dir=temp_working_dir, timeout=300)
+
+    assert client.is_available()
+    assert client.is_available()
+    assert mock_which.call_count == 1
+
+    monkeypatch.setenv("PATH", "/opt/bin")
+    assert client.is_available()
+    assert mock_which.call_count == 2
+
+
 @patch("subprocess.run")
 @patch("shutil.which")
 def test_get_version(mock_which, mock_run, temp_working_dir):
     """Test getting Claude Code version."""
-    client = ClaudeCodeClient(working_dir=temp_working_dir, timeout=300)
-
     # Test when claude is available
     mock_which.return_value = "/usr/local/bin/claude"
     mock_run.return_value = MagicMock(
         returncode=0, stdout="claude 1.2.3\n", stderr=""
     )
 
+    client = ClaudeCodeClient(working_dir=temp_working_dir, timeout=300)
     version = client.get_version()
     assert version == "1.2.3"
+    assert mock_run.call_args[0][0] == ["/usr/local/bin/claude", "--version"]
 
     # Test when claude is not available
     mock_which.return_value = None
+    client = ClaudeCodeClient(working_dir=temp_working_dir, timeout=300)
     version = client.get_version()
     assert version is None
 
 
+@patch("subprocess.run")
+@patch("shutil.which")
+def test_get_version_cached(mock_which, mock_run, temp_working_dir):
+    """Test that the version is only queried once per client."""
+    mock_which.return_value = "/usr/local/bin/claude"
+    mock_run.return_value = MagicMock(
+        returncode=0, stdout="claude 1.2.3\n", stderr=""
+    )
+    client = ClaudeCodeClient(working_dir=temp_working_dir, timeout=300)
+
+    assert client.get_version() == "1.2.3"
+    assert client.get_version() == "1.2.3"
+    assert mock_run.call_count == 1
+
+
 @patch("subprocess.run")
 def test_request_fix_not_available(mock_run, temp_working_dir, test_context):
     """Test request_fix when Claude CLI is not available."""
@@ -153,6 +196,24 @@ def test_request_fix_timeout(mock_run, temp_working_dir, test_context):
     assert "timed out" in response.error_message.lower()
 
 
+@patch("subprocess.run")
+def test_request_fix_timeout_partial_output(mock_run, temp_working_dir, test_context):
+    """Test that partial output cut mid-character is still reported."""
+    client = ClaudeCodeClient(working_dir=temp_working_dir, timeout=10)
+
+    # Output truncated in the middle of a multi-byte UTF-8 character
+    mock_run.side_effect = subprocess.TimeoutExpired(
+        cmd=["claude"], timeout=10, output="Working… ".encode()[:-2], stderr=None
+    )
+
+    with patch.object(client, "is_available", return_value=True):
+        response = client.request_fix(test_context)
+
+    assert not response.success
+    assert response.raw_output.startswith("STDOUT:\nWorking")
+    assert response.raw_output.endswith("STDERR:\n")
+
+
 @patch("subprocess.run")
 def test_request_fix_subprocess_error(mock_run, temp_working_dir, test_context):
     """Test fix request with subprocess error."""
@@ -168,6 +229,137 @@ def test_request_fix_subprocess_error(mock_run, temp_working_dir, test_context):
     assert response.error_message is not None
 
 
+@patch("subprocess.run")
+def test_request_fix_batch_splits_output(mock_run, temp_working_dir, test_context):
+    """Test that a batched reply is split and attributed per task."""
+    client = ClaudeCodeClient(working_dir=temp_working_dir, timeout=300)
+
+    mock_run.return_value = MagicMock(
+        returncode=0,
+        stdout=(
+            "--- TASK 1 ---\nFixed it. Edit[file_path='first.py']\n"
+            "--- TASK 2 ---\nFixed it. Edit[file_path='second.py']\n"
+        ),
+        stderr="",
+    )
+
+    with patch.object(client, "is_available", return_value=True):
+        responses = client.request_fix_batch([test_context, test_context, test_context])
+
+    assert mock_run.call_count == 1
+    assert "--- TASK 3 ---" in mock_run.call_args[0][0][2]
+    assert [r.files_changed for r in responses[:2]] == [["first.py"], ["second.py"]]
+    assert not responses[2].success
+    assert "task 3" in responses[2].error_message
+
+
+@patch("subprocess.run")
+def test_request_fix_batch_splits_stream_json(mock_run, temp_working_dir, test_context):
+    """Test that tool events in a stream-json batch count for their own task."""
+    client = ClaudeCodeClient(working_dir=temp_working_dir, timeout=300)
+
+    def edit(path):
+        return {"type": "tool_use", "name": "Edit", "input": {"file_path": path}}
+
+    events = [
+        {"type": "system", "subtype": "init"},
+        {
+            "type": "assistant",
+            "message": {
+                "content": [
+                    {"type": "text", "text": "--- TASK 1 ---\nThe issue was a typo."},
+                    edit("/repo/first.py"),
+                ]
+            },
+        },
+        {"type": "user", "message": {"content": [{"type": "tool_result", "content": "ok"}]}},
+        {
+            "type": "assistant",
+            "message": {
+                "content": [
+                    {"type": "text", "text": "Done.\n--- TASK 2 ---\nThe issue was a bad path."},
+                    edit("/repo/second.py"),
+                ]
+            },
+        },
+        {"type": "result", "is_error": False, "result": "The issue was a bad path."},
+    ]
+    mock_run.return_value = MagicMock(
+        returncode=0, stdout="\n".join(json.dumps(event) for event in events), stderr=""
+    )
+
+    with patch.object(client, "is_available", return_value=True):
+        responses = client.request_fix_batch([test_context, test_context])
+
+    assert "stream-json" in mock_run.call_args[0][0]
+    assert [r.files_changed for r in responses] == [["/repo/first.py"], ["/repo/second.py"]]
+    assert responses[0].response_text == "The issue was a typo.\n\nDone."
+    assert responses[1].explanation == "The issue was a bad path."
+
+
+@patch("subprocess.run")
+def test_request_fix_batch_keeps_tool_restrictions(mock_run, temp_working_dir, test_context):
+    """Test that only contexts with the same allowed tools share a call."""
+    client = ClaudeCodeClient(working_dir=temp_working_dir, timeout=300)
+    read_only = dataclasses.replace(
+        test_context, config=LazarusConfig(healing=HealingConfig(allowed_tools=["Read"]))
+    )
+
+    mock_run.return_value = MagicMock(
+        returncode=0,
+        stdout=(
+            "--- TASK 1 ---\nFixed it. Edit[file_path='first.py']\n"
+            "--- TASK 2 ---\nFixed it. Edit[file_path='second.py']\n"
+        ),
+        stderr="",
+    )
+
+    with patch.object(client, "is_available", return_value=True):
+        responses = client.request_fix_batch([test_context, read_only, test_context])
+
+    assert len(responses) == 3
+    assert mock_run.call_count == 2
+    tools_args = sorted(
+        call.args[0][call.args[0].index("--allowedTools") + 1]
+        for call in mock_run.call_args_list
+    )
+    assert tools_args == ["Edit,Write,Read", "Read"]
+    assert [r.files_changed for r in (responses[0], responses[2])] == [
+        ["first.py"],
+        ["second.py"],
+    ]
+
+
+@patch("subprocess.run")
+def test_request_fix_batch_cli_error(mock_run, temp_working_dir, test_context):
+    """Test that a CLI failure before any task output is reported for every task."""
+    client = ClaudeCodeClient(working_dir=temp_working_dir, timeout=300)
+
+    mock_run.return_value = MagicMock(
+        returncode=1, stdout="", stderr="Error: Invalid API key"
+    )
+
+    with patch.object(client, "is_available", return_value=True):
+        responses = client.request_fix_batch([test_context, test_context])
+
+    assert len(responses) == 2
+    assert all("authentication failed" in r.error_message for r in responses)
+
+
+@patch("subprocess.run")
+def test_request_fix_batch_timeout(mock_run, temp_working_dir, test_context):
+    """Test that a batch timeout fails every task."""
+    client = ClaudeCodeClient(working_dir=temp_working_dir, timeout=10)
+
+    mock_run.side_effect = subprocess.TimeoutExpired(cmd=["claude"], timeout=10)
+
+    with patch.object(client, "is_available", return_value=True):
+        responses = client.request_fix_batch([test_context, test_context])
+
+    assert len(responses) == 2
+    assert all("timed out" in r.error_message for r in responses)
+
+
 def test_get_allowed_tools_default(temp_working_dir, test_context):
     """Test getting default allowed tools."""
     client = ClaudeCodeClient(working_dir=temp_working_dir, timeout=300)
@@ -240,6 +432,24 @@ def test_get_allowed_tools_with_forbidden(temp_working_dir):
     assert "Edit" in tools
 
 
+def test_allowed_tools_arg_cached(temp_working_dir, test_context):
+    """Test that the joined --allowedTools value is reused per config."""
+    client = ClaudeCodeClient(working_dir=temp_working_dir, timeout=300)
+
+    with patch.object(
+        client, "_get_allowed_tools", wraps=client._get_allowed_tools
+    ) as mock_get:
+        assert client._allowed_tools_arg(test_context) == "Edit,Write,Read"
+        assert client._allowed_tools_arg(test_context) == "Edit,Write,Read"
+        assert mock_get.call_count == 1
+
+        test_context.config = LazarusConfig(
+            healing=HealingConfig(allowed_tools=["Read"])
+        )
+        assert client._allowed_tools_arg(test_context) == "Read"
+        assert mock_get.call_count == 2
+
+
 @patch("subprocess.run")
 def test_request_fix_with_retry_success_first_attempt(
     mock_run, temp_working_dir, test_context
@@ -297,3 +507,73 @@ def test_request_fix_with_retry_all_attempts_fail(
 
     assert not response.success
     assert attempts == 3
+
+
+async def test_request_fix_async_success(temp_working_dir, test_context):
+    """Test that the async fix request parses the process output."""
+    client = ClaudeCodeClient(working_dir=temp_working_dir, timeout=300)
+    process = MagicMock(returncode=0)
+    process.communicate = AsyncMock(
+        return_value=(b"I've fixed the issue. Edit[file_path='script.py']", b"")
+    )
+
+    with (
+        patch.object(client, "is_available", return_value=True),
+        patch(
+            "asyncio.create_subprocess_exec", AsyncMock(return_value=process)
+        ) as mock_exec,
+    ):
+        response = await client.request_fix_async(test_context)
+
+    assert response.success
+    assert response.files_changed == ["script.py"]
+    assert mock_exec.call_args.kwargs["cwd"] == client.working_dir
+
+
+async def test_request_diagnosis_async_timeout(temp_working_dir, test_context):
+    """Test that a timed-out async request kills the process."""
+    client = ClaudeCodeClient(working_dir=temp_working_dir, timeout=0.01)
+
+    async def never_finishes():
+        await asyncio.sleep(10)
+
+    process = MagicMock()
+    process.communicate = never_finishes
+    process.wait = AsyncMock(return_value=-9)
+
+    with (
+        patch.object(client, "is_available", return_value=True),
+        patch("asyncio.create_subprocess_exec", AsyncMock(return_value=process)),
+    ):
+        response = await client.request_diagnosis_async(test_context)
+
+    assert not response.success
+    assert "timed out" in response.error_message.lower()
+    process.kill.assert_called_once()
+
+
+async def test_request_fix_async_cancelled_kills_process(temp_working_dir, test_context):
+    """Test that cancelling an async request kills the process."""
+    client = ClaudeCodeClient(working_dir=temp_working_dir, timeout=300)
+    started = asyncio.Event()
+
+    async def never_finishes():
+        started.set()
+        await asyncio.sleep(10)
+
+    process = MagicMock(returncode=None)
+    process.communicate = never_finishes
+    process.wait = AsyncMock(return_value=-9)
+
+    with (
+        patch.object(client, "is_available", return_value=True),
+        patch("asyncio.create_subprocess_exec", AsyncMock(return_value=process)),
+    ):
+        task = asyncio.create_task(client.request_fix_async(test_context))
+        await started.wait()
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    process.kill.assert_called_once()
+    process.wait.assert_awaited_once()
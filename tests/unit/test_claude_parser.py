@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import json
+
 from lazarus.claude.parser import (
     _extract_changed_files,
     _extract_explanation,
@@ -69,6 +71,15 @@ def test_parse_generic_error():
     assert len(response.files_changed) == 0
 
 
+def test_parse_generic_error_uses_last_stderr_line():
+    """Test that the last non-blank stderr line becomes the error message."""
+    stderr = "Starting up\nError: script crashed\n\n  \n"
+
+    response = parse_claude_output("", stderr, 1)
+
+    assert response.error_message == "Error: script crashed"
+
+
 def test_parse_no_changes():
     """Test parsing output with no file changes."""
     stdout = "I analyzed the script but couldn't identify any issues to fix."
@@ -116,6 +127,16 @@ Updated config.yaml
     assert "config.yaml" in files
 
 
+def test_extract_changed_files_quoted_paths():
+    """Test that quoted paths are extracted without their quotes."""
+    output = 'Edited "scripts/run.py" and Wrote to `config.yaml`'
+
+    files = _extract_changed_files(output)
+
+    assert "scripts/run.py" in files
+    assert "config.yaml" in files
+
+
 def test_extract_changed_files_deduplication():
     """Test that duplicate files are removed."""
     output = """
@@ -152,6 +173,15 @@ at the top of the file. The script should now run without errors.
     assert "import" in explanation.lower() or "issue" in explanation.lower()
 
 
+def test_extract_explanation_limits_sentences():
+    """Test that at most three explanation sentences are combined, in order."""
+    output = "I've fixed the bug. The issue was a typo. Updated the import. Changed the loop."
+
+    explanation = _extract_explanation(output)
+
+    assert explanation == "I've fixed the bug. The issue was a typo. Updated the import."
+
+
 def test_extract_explanation_fallback():
     """Test explanation extraction with no clear explanation."""
     output = "Some generic output without clear explanation patterns."
@@ -160,3 +190,104 @@ def test_extract_explanation_fallback():
 
     # Should return the generic fallback message
     assert len(explanation) > 0
+
+
+def test_parse_stream_json_output():
+    """Test parsing structured stream-json output."""
+    events = [
+        {"type": "system", "subtype": "init"},
+        {
+            "type": "assistant",
+            "message": {
+                "content": [
+                    {"type": "text", "text": "The issue was a missing colon."},
+                    {
+                        "type": "tool_use",
+                        "name": "Edit",
+                        "input": {"file_path": "/repo/example_job.py"},
+                    },
+                    {
+                        "type": "tool_use",
+                        "name": "Read",
+                        "input": {"file_path": "/repo/other.py"},
+                    },
+                ]
+            },
+        },
+        {"type": "result", "subtype": "success", "is_error": False, "result": "Done"},
+    ]
+    stdout = "\n".join(json.dumps(event) for event in events)
+
+    response = parse_claude_output(stdout, "", 0)
+
+    assert response.success
+    assert response.files_changed == ["/repo/example_job.py"]
+    assert response.explanation == "The issue was a missing colon."
+
+
+def test_parse_stream_json_error_result():
+    """Test that an error result event marks the attempt as failed."""
+    stdout = json.dumps(
+        {"type": "result", "subtype": "error_max_turns", "is_error": True, "result": ""}
+    )
+
+    response = parse_claude_output(stdout, "", 0)
+
+    assert not response.success
+    assert response.error_message == "Claude Code reported an error"
+
+
+def test_parse_stream_json_ignores_errors_in_tool_results():
+    """Test that error keywords inside tool payloads are not classified."""
+    events = [
+        {
+            "type": "assistant",
+            "message": {
+                "content": [
+                    {"type": "tool_use", "name": "Read", "input": {"file_path": "/repo/api.py"}},
+                ]
+            },
+        },
+        {
+            "type": "user",
+            "message": {
+                "content": [
+                    {
+                        "type": "tool_result",
+                        "content": 'raise RuntimeError("Unauthorized")\n# rate limit exceeded',
+                    },
+                ]
+            },
+        },
+        {
+            "type": "assistant",
+            "message": {
+                "content": [
+                    {"type": "text", "text": "I've fixed the retry loop in api.py."},
+                    {"type": "tool_use", "name": "Edit", "input": {"file_path": "/repo/api.py"}},
+                ]
+            },
+        },
+        {"type": "result", "subtype": "success", "is_error": False, "result": "Done"},
+    ]
+    stdout = "\n".join(json.dumps(event) for event in events)
+
+    response = parse_claude_output(stdout, "", 0)
+
+    assert response.success
+    assert response.files_changed == ["/repo/api.py"]
+    assert response.error_message is None
+    assert response.response_text == "I've fixed the retry loop in api.py.\n\nDone"
+    assert response.raw_output == stdout
+
+
+def test_parse_stream_json_auth_error_result():
+    """Test that an auth failure in the final result event is classified."""
+    stdout = json.dumps(
+        {"type": "result", "is_error": True, "result": "Invalid API key - please run /login"}
+    )
+
+    response = parse_claude_output(stdout, "", 1)
+
+    assert not response.success
+    assert "authentication failed" in response.error_message
@@ -5,13 +5,19 @@ from __future__ import annotations
 from datetime import UTC, datetime
 from pathlib import Path
 
-from lazarus.claude.prompts import build_healing_prompt, build_retry_prompt
+from lazarus.claude.prompts import (
+    _truncate_middle,
+    build_diagnosis_prompt,
+    build_healing_prompt,
+    build_retry_prompt,
+)
 from lazarus.config.schema import LazarusConfig, ScriptConfig
 from lazarus.core.context import (
     CommitInfo,
     ExecutionResult,
     GitContext,
     HealingContext,
+    PreviousAttempt,
     SystemContext,
 )
 
@@ -101,6 +107,44 @@ def test_build_healing_prompt_with_git_context():
     assert "John Doe" in prompt
 
 
+def test_build_diagnosis_prompt_includes_shared_sections():
+    """Test that the diagnosis prompt carries the same context as healing."""
+    context = HealingContext(
+        script_path=Path("/path/to/script.py"),
+        script_content="print('hello')\n",
+        execution_result=ExecutionResult(
+            exit_code=2,
+            stdout="partial output",
+            stderr="ValueError: bad input",
+            duration=0.1,
+            timestamp=datetime.now(UTC),
+        ),
+        git_context=GitContext(
+            branch="feature",
+            recent_commits=[],
+            uncommitted_changes="",
+            repo_root=Path("/path/to"),
+        ),
+        system_context=SystemContext(
+            os_name="Linux",
+            os_version="6.1.0",
+            python_version="3.12.1 (main)",
+            shell="/bin/zsh",
+            cwd=Path("/path/to"),
+        ),
+        config=LazarusConfig(),
+    )
+
+    prompt = build_diagnosis_prompt(context)
+
+    assert "DIAGNOSIS ONLY" in prompt
+    assert "Exit Code: 2" in prompt
+    assert "ValueError: bad input" in prompt
+    assert "Branch: feature" in prompt
+    assert "Python: 3.12.1\n" in prompt
+    assert "# PREVIOUS HEALING ATTEMPTS" not in prompt
+
+
 def test_build_healing_prompt_with_custom_config():
     """Test building prompt with custom script config."""
     script_config = ScriptConfig(
@@ -143,6 +187,82 @@ def test_build_healing_prompt_with_custom_config():
     assert "config.yaml" in prompt
 
 
+def test_build_healing_prompt_uses_matching_script_config():
+    """Test that only the config entry for the healed script is used."""
+    context = HealingContext(
+        script_path=Path("/path/to/script.py"),
+        script_content="print('hello')\n",
+        execution_result=ExecutionResult(
+            exit_code=1,
+            stdout="",
+            stderr="Error",
+            duration=0.1,
+            timestamp=datetime.now(UTC),
+        ),
+        git_context=None,
+        system_context=SystemContext(
+            os_name="Darwin",
+            os_version="23.0.0",
+            python_version="3.11.0",
+            shell="/bin/bash",
+            cwd=Path("/path/to"),
+        ),
+        config=LazarusConfig(
+            scripts=[
+                ScriptConfig(
+                    name="other",
+                    path=Path("other.py"),
+                    description="Other script",
+                    custom_prompt="Other handling",
+                ),
+                ScriptConfig(
+                    name="test-script",
+                    path=Path("script.py"),
+                    description="Matching script",
+                    success_criteria={"contains": "done"},
+                ),
+            ]
+        ),
+    )
+
+    prompt = build_healing_prompt(context)
+
+    assert "Description: Matching script" in prompt
+    assert "- contains: done" in prompt
+    assert "Other script" not in prompt
+    assert "# ADDITIONAL CONTEXT" not in prompt
+
+
+def test_build_healing_prompt_keeps_braces_in_content():
+    """Test that braces in script content are not treated as placeholders."""
+    context = HealingContext(
+        script_path=Path("/path/to/script.py"),
+        script_content="print(f'{name}')\ndata = {'key': '{value}'}\n",
+        execution_result=ExecutionResult(
+            exit_code=1,
+            stdout="",
+            stderr="KeyError: '{value}'",
+            duration=0.25,
+            timestamp=datetime.now(UTC),
+        ),
+        git_context=None,
+        system_context=SystemContext(
+            os_name="Darwin",
+            os_version="23.0.0",
+            python_version="3.11.0",
+            shell="/bin/bash",
+            cwd=Path("/path/to"),
+        ),
+        config=LazarusConfig(),
+    )
+
+    prompt = build_healing_prompt(context)
+
+    assert "data = {'key': '{value}'}" in prompt
+    assert "KeyError: '{value}'" in prompt
+    assert "Duration: 0.25s" in prompt
+
+
 def test_build_healing_prompt_truncates_long_output():
     """Test that very long output is truncated."""
     long_stderr = "Error line\n" * 1000  # Very long error output
@@ -176,6 +296,97 @@ def test_build_healing_prompt_truncates_long_output():
     assert "truncated" in prompt.lower()
 
 
+def test_build_healing_prompt_compacts_output_for_huge_inputs():
+    """Test that huge inputs get tighter output truncation."""
+    stderr = "E" * 1500 + "M" * 3000 + "Z" * 1500
+
+    def build(script_content: str) -> str:
+        context = HealingContext(
+            script_path=Path("/path/to/script.py"),
+            script_content=script_content,
+            execution_result=ExecutionResult(
+                exit_code=1,
+                stdout="",
+                stderr=stderr,
+                duration=0.1,
+                timestamp=datetime.now(UTC),
+            ),
+            git_context=None,
+            system_context=SystemContext(
+                os_name="Darwin",
+                os_version="23.0.0",
+                python_version="3.11.0",
+                shell="/bin/bash",
+                cwd=Path("/path/to"),
+            ),
+            config=LazarusConfig(),
+        )
+        return build_healing_prompt(context)
+
+    normal = build("print('hello')\n")
+    assert "E" * 1500 + "M" * 1000 in normal
+
+    huge_script = "x = 1\n" * 40_000
+    compact = build(huge_script)
+    assert huge_script in compact
+    assert "E" * 1000 + "\n\n... [truncated]" in compact
+    assert "MMM" not in compact.split("# SCRIPT")[0]
+
+
+def test_build_healing_prompt_with_previous_attempts():
+    """Test that previous attempts are listed in order."""
+    context = HealingContext(
+        script_path=Path("/path/to/script.py"),
+        script_content="print('hello')\n",
+        execution_result=ExecutionResult(
+            exit_code=1,
+            stdout="",
+            stderr="Error",
+            duration=0.1,
+            timestamp=datetime.now(UTC),
+        ),
+        git_context=None,
+        system_context=SystemContext(
+            os_name="Darwin",
+            os_version="23.0.0",
+            python_version="3.11.0",
+            shell="/bin/bash",
+            cwd=Path("/path/to"),
+        ),
+        config=LazarusConfig(),
+        previous_attempts=[
+            PreviousAttempt(
+                attempt_number=1,
+                claude_response_summary="Renamed the variable",
+                changes_made=["script.py", "utils.py"],
+                error_after="NameError: name 'y' is not defined",
+            ),
+            PreviousAttempt(
+                attempt_number=2,
+                claude_response_summary="Added an import",
+                changes_made=[],
+                error_after="E" * 2000,
+            ),
+        ],
+    )
+
+    prompt = build_healing_prompt(context)
+
+    assert "# PREVIOUS HEALING ATTEMPTS" in prompt
+    assert "Files modified:\n  - script.py\n  - utils.py\n" in prompt
+    assert prompt.index("## Attempt 1:") < prompt.index("## Attempt 2:")
+    assert "E" * 500 + "\n... [truncated] ...\n" + "E" * 500 in prompt
+    assert "E" * 501 not in prompt
+
+
+def test_truncate_middle():
+    """Test that only text over the limit loses its middle."""
+    assert _truncate_middle("abcdef", 6) == "abcdef"
+
+    truncated = _truncate_middle("a" * 10 + "b" * 10, 10, marker="|")
+    assert truncated == "aaaaa|bbbbb"
+
+
 def test_build_retry_prompt():
     """Test building a retry prompt."""
     context = HealingContext(
@@ -210,3 +421,36 @@ def test_build_retry_prompt():
     # Should still include base prompt elements
     assert "# TASK" in retry_prompt
     assert "# INSTRUCTIONS" in retry_prompt
+
+
+def test_build_retry_prompt_with_instructions_heading_in_script():
+    """Test that a script containing the instructions heading stays intact."""
+    script_content = "# INSTRUCTIONS\n# run with --fast\nprint('hello')\n"
+    context = HealingContext(
+        script_path=Path("/path/to/script.py"),
+        script_content=script_content,
+        execution_result=ExecutionResult(
+            exit_code=1,
+            stdout="",
+            stderr="Error",
+            duration=0.1,
+            timestamp=datetime.now(UTC),
+        ),
+        git_context=None,
+        system_context=SystemContext(
+            os_name="Darwin",
+            os_version="23.0.0",
+            python_version="3.11.0",
+            shell="/bin/bash",
+            cwd=Path("/path/to"),
+        ),
+        config=LazarusConfig(),
+    )
+
+    retry_prompt = build_retry_prompt(context, "Nothing changed", attempt_number=3)
+
+    assert script_content in retry_prompt
+    assert "Remember: Be surgical" in retry_prompt
+    assert retry_prompt.index("# RETRY ATTEMPT 3") < retry_prompt.index(
+        "1. Analyze the error"
+    )
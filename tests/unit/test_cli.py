@@ -11,6 +11,24 @@ def test_cli_app_exists():
     assert hasattr(app, 'command')
 
 
+def test_cli_import_defers_healing_modules():
+    """Test that importing the CLI does not load the healing machinery."""
+    import subprocess
+    import sys
+
+    code = (
+        "import sys, lazarus.cli; "
+        "print(sorted(m for m in ('lazarus.config.schema', 'lazarus.core.healer', "
+        "'lazarus.claude.client', 'rich.progress', 'rich.table', 'json') "
+        "if m in sys.modules))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+
+    assert result.stdout.strip() == "[]"
+
+
 def test_cli_commands_registered():
     """Test that all expected commands are registered."""
     from lazarus.cli import app
@@ -113,3 +131,122 @@ def test_show_config_summary():
     _show_config_summary(config)
 
     # Test it doesn't crash
+
+
+def test_format_history_timestamp():
+    """Test history timestamps are shown to minute precision."""
+    from lazarus.cli import _format_history_timestamp
+
+    assert _format_history_timestamp("2024-01-15T10:30:45.123456+00:00") == "2024-01-15 10:30"
+    assert _format_history_timestamp("2024-01-15 10:30:45") == "2024-01-15 10:30"
+    assert _format_history_timestamp("not a timestamp") == "not a timestamp"
+
+
+def test_display_history_table():
+    """Test history rows show the formatted timestamp and script file name."""
+    from lazarus import cli
+    from lazarus.logging.history import HistoryRecord
+
+    record = HistoryRecord(
+        id="abc",
+        timestamp="2024-01-15T10:30:45+00:00",
+        script_path="/srv/jobs/nightly.py",
+        success=True,
+        attempts_count=2,
+        duration=12.34,
+    )
+
+    with cli.console.capture() as capture:
+        cli._display_history_table([record])
+    output = capture.get()
+
+    assert "2024-01-15 10:30" in output
+    assert "nightly.py" in output
+    assert "/srv/jobs" not in output
+    assert "12.3s" in output
+
+
+def test_spinner_prints_plain_line_when_not_a_terminal():
+    """Test the spinner falls back to one line and skips rich.progress off a TTY."""
+    import subprocess
+    import sys
+
+    code = (
+        "import sys\n"
+        "from lazarus.cli import _spinner\n"
+        "with _spinner('Working...'):\n"
+        "    pass\n"
+        "print('rich.progress' in sys.modules)\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+
+    assert result.stdout.splitlines() == ["Working...", "False"]
+
+
+def test_banner_styles_title_and_keeps_brackets_literal():
+    """Test banner text styles only the title and does not parse markup in lines."""
+    from lazarus.cli import _banner
+
+    text = _banner("Healing Failed", "red", "Error: bad [bold]value[/bold]")
+
+    assert text.plain == "Healing Failed\nError: bad [bold]value[/bold]"
+    assert [(span.start, span.end, str(span.style)) for span in text.spans] == [
+        (0, len("Healing Failed"), "bold red")
+    ]
+
+
+def test_display_healing_result_verbose_lists_attempts(mock_verification_result_success):
+    """Test verbose healing results render one table row per attempt."""
+    from lazarus import cli
+    from lazarus.claude.parser import ClaudeResponse
+    from lazarus.core.healer import HealingAttempt, HealingResult
+
+    attempt = HealingAttempt(
+        attempt_number=1,
+        claude_response=ClaudeResponse(
+            success=True,
+            explanation="Fixed [index] lookup",
+            files_changed=["backup.py"],
+            error_message=None,
+            raw_output="",
+        ),
+        verification=mock_verification_result_success,
+        duration=2.5,
+    )
+    result = HealingResult(
+        success=True,
+        attempts=[attempt],
+        final_execution=mock_verification_result_success.execution_result,
+        duration=3.0,
+    )
+
+    with cli.console.capture() as capture:
+        cli._display_healing_result(result, verbose=True)
+    output = capture.get()
+
+    assert "Healing Attempts" in output
+    assert "2.50s" in output
+    assert "success" in output
+    assert "Fixed [index] lookup" in output
+    assert "backup.py" in output
+
+
+def test_init_leaves_unrelated_tmp_file_alone(tmp_path):
+    """Test that init writes through a unique temporary file."""
+    from typer.testing import CliRunner
+
+    from lazarus.cli import app
+
+    output = tmp_path / "lazarus.yaml"
+    user_file = tmp_path / "lazarus.yaml.tmp"
+    user_file.write_text("keep me")
+
+    result = CliRunner().invoke(app, ["init", "--output", str(output)])
+
+    assert result.exit_code == 0
+    assert "scripts:" in output.read_text()
+    assert output.stat().st_mode & 0o044
+    assert user_file.read_text() == "keep me"
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["lazarus.yaml", "lazarus.yaml.tmp"]
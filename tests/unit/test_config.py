@@ -7,7 +7,13 @@ from pathlib import Path
 import pytest
 from pydantic import ValidationError
 
-from lazarus.config.loader import ConfigError, load_config, validate_config_file
+from lazarus.config.loader import (
+    ConfigError,
+    expand_env_vars,
+    find_config_file,
+    load_config,
+    validate_config_file,
+)
 from lazarus.config.schema import (
     DiscordConfig,
     GitConfig,
@@ -438,6 +444,11 @@ class TestConfigLoader:
         with pytest.raises(ConfigError, match="not found"):
             load_config(Path("/nonexistent/config.yaml"))
 
+    def test_load_config_directory_reported_as_not_found(self, tmp_path):
+        """Test that a directory passed as the config path is reported as missing."""
+        with pytest.raises(ConfigError, match="not found"):
+            load_config(tmp_path)
+
     def test_load_invalid_yaml(self, tmp_path):
         """Test loading invalid YAML."""
         config_file = tmp_path / "invalid.yaml"
@@ -446,6 +457,14 @@ class TestConfigLoader:
         with pytest.raises(ConfigError):
             load_config(config_file)
 
+    def test_load_config_reports_validation_errors(self, tmp_path):
+        """Test that schema errors name the offending field."""
+        config_file = tmp_path / "lazarus.yaml"
+        config_file.write_text("healing:\n  max_attempts: 0\n")
+
+        with pytest.raises(ConfigError, match=r"healing -> max_attempts: Input should be"):
+            load_config(config_file)
+
     def test_validate_config_file_valid(self, temp_config_file):
         """Test validating valid config file."""
         is_valid, errors = validate_config_file(temp_config_file)
@@ -486,6 +505,159 @@ notifications:
         assert config.notifications.slack is not None
         assert "example.com" in config.notifications.slack.webhook_url
 
+    def test_load_config_reuses_parsed_yaml(self, temp_config_file, monkeypatch):
+        """Test that unchanged config files are only parsed once."""
+        import yaml
+
+        from lazarus.config import loader
+
+        loader.clear_config_cache()
+        calls = []
+        real_load = yaml.load
+
+        def counting_load(stream, Loader):
+            calls.append(stream)
+            return real_load(stream, Loader=Loader)
+
+        monkeypatch.setattr(loader.yaml, "load", counting_load)
+
+        first = load_config(temp_config_file)
+        first.healing.max_attempts = 7
+        second = load_config(temp_config_file)
+
+        assert len(calls) == 1
+        assert second is not first
+        assert second.healing.max_attempts == 3
+
+        temp_config_file.write_text(temp_config_file.read_text().replace("3\n", "5\n", 1))
+        third = load_config(temp_config_file)
+
+        assert len(calls) == 2
+        assert third.healing.max_attempts == 5
+
+    def test_load_config_skips_reading_unchanged_old_file(self, temp_config_file, monkeypatch):
+        """Test that a settled, unchanged config is served without re-reading it."""
+        import os
+
+        from lazarus.config import loader
+
+        loader.clear_config_cache()
+        os.utime(temp_config_file, (1_700_000_000, 1_700_000_000))
+        load_config(temp_config_file)
+
+        def fail_read(_self):
+            raise AssertionError("config file was read again")
+
+        monkeypatch.setattr(Path, "read_bytes", fail_read)
+        config = load_config(temp_config_file)
+
+        assert config.healing.max_attempts == 3
+
+
+class TestFindConfigFile:
+    """Tests for config file discovery."""
+
+    def test_finds_config_in_parent_directory(self, tmp_path):
+        """Test that the search walks up from the start directory."""
+        config_file = tmp_path / "lazarus.yml"
+        config_file.write_text("scripts: []\n")
+        nested = tmp_path / "a" / "b"
+        nested.mkdir(parents=True)
+
+        assert find_config_file(nested) == config_file
+
+    def test_prefers_yaml_extension(self, tmp_path):
+        """Test that lazarus.yaml wins over lazarus.yml in the same directory."""
+        (tmp_path / "lazarus.yaml").write_text("scripts: []\n")
+        (tmp_path / "lazarus.yml").write_text("scripts: []\n")
+
+        assert find_config_file(tmp_path) == tmp_path / "lazarus.yaml"
+
+    def test_defaults_to_cwd(self, tmp_path, monkeypatch):
+        """Test that the search starts from the current directory by default."""
+        config_file = tmp_path / "lazarus.yaml"
+        config_file.write_text("scripts: []\n")
+        monkeypatch.chdir(tmp_path)
+
+        assert find_config_file() == Path.cwd() / "lazarus.yaml"
+
+    def test_ignores_directories_named_like_config(self, tmp_path):
+        """Test that a directory called lazarus.yaml is not returned."""
+        (tmp_path / "lazarus.yaml").mkdir()
+
+        assert find_config_file(tmp_path) != tmp_path / "lazarus.yaml"
+
+
+class TestExpandEnvVars:
+    """Tests for environment variable expansion."""
+
+    def test_expands_set_variable(self, monkeypatch):
+        """Test that set variables are substituted, including several per string."""
+        monkeypatch.setenv("LAZ_HOST", "example.com")
+        monkeypatch.setenv("LAZ_PORT", "8080")
+
+        assert expand_env_vars("https://${LAZ_HOST}:${LAZ_PORT}/") == "https://example.com:8080/"
+
+    def test_uses_default_when_unset(self, monkeypatch):
+        """Test that ${VAR:-default} falls back to the default."""
+        monkeypatch.delenv("LAZ_MISSING", raising=False)
+
+        assert expand_env_vars("${LAZ_MISSING:-fallback}") == "fallback"
+
+    def test_keeps_placeholder_when_unset_without_default(self, monkeypatch):
+        """Test that unresolvable placeholders are left as written."""
+        monkeypatch.delenv("LAZ_MISSING", raising=False)
+
+        assert expand_env_vars("${LAZ_MISSING}") == "${LAZ_MISSING}"
+        assert expand_env_vars("${LAZ_MISSING:-}") == "${LAZ_MISSING:-}"
+
+    def test_expands_nested_containers(self, monkeypatch):
+        """Test that nested dicts and lists are expanded and other values kept."""
+        monkeypatch.setenv("LAZ_TOKEN", "secret")
+        data = {
+            "list": ["${LAZ_TOKEN}", 3, None],
+            "nested": {"key": "token=${LAZ_TOKEN}", "flag": True},
+            "plain": "no placeholders",
+        }
+
+        assert expand_env_vars(data) == {
+            "list": ["secret", 3, None],
+            "nested": {"key": "token=secret", "flag": True},
+            "plain": "no placeholders",
+        }
+        assert data["list"][0] == "${LAZ_TOKEN}"
+
+    def test_expands_nesting_deeper_than_recursion_limit(self, monkeypatch):
+        """Test that deeply nested data does not hit Python's recursion limit."""
+        import sys
+
+        monkeypatch.setenv("LAZ_LEAF", "leaf")
+        depth = sys.getrecursionlimit() + 100
+        data: list = ["${LAZ_LEAF}"]
+        for _ in range(depth):
+            data = [data]
+
+        result = expand_env_vars({"root": data})
+
+        node = result["root"]
+        for _ in range(depth):
+            node = node[0]
+        assert node == ["leaf"]
+
+    def test_expands_recursive_alias(self, monkeypatch):
+        """Test that a self-referencing YAML alias terminates and stays shared."""
+        import yaml
+
+        monkeypatch.setenv("LAZ_TOKEN", "secret")
+        data = yaml.safe_load("a: &x ['${LAZ_TOKEN}', *x]\nb: *x\n")
+
+        result = expand_env_vars(data)
+
+        assert result["a"][0] == "secret"
+        assert result["a"][1] is result["a"]
+        assert result["b"] is result["a"]
+        assert data["a"][0] == "${LAZ_TOKEN}"
+
 
 class TestConfigExamples:
     """Tests for configuration examples."""
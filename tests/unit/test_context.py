@@ -61,6 +61,7 @@ class TestExecutionResult:
             timestamp=custom_time,
         )
         assert result.timestamp == custom_time
+        assert result.timestamp_iso == "2024-01-01T12:00:00+00:00"
 
 
 class TestSystemContext:
@@ -96,6 +97,18 @@ class TestSystemContext:
 
         assert context.shell == "unknown"
 
+    def test_python_version_short(self):
+        """Test that build details are dropped from the Python version."""
+        context = SystemContext(
+            os_name="Linux",
+            os_version="5.15.0",
+            python_version="3.11.7 (main, Jan  1 2024, 00:00:00) [GCC 12.2.0]",
+            shell="/bin/bash",
+            cwd=Path("/home/user/project"),
+        )
+
+        assert context.python_version_short == "3.11.7"
+
 
 class TestGitContext:
     """Tests for get_git_context function."""
@@ -166,3 +166,19 @@ def test_has_uncommitted_changes_no_git(basic_config, tmp_path):
     # Should return False (no git repo)
     has_changes = healer._has_uncommitted_changes(script)
     assert has_changes is False
+
+
+def test_healer_finds_script_config_by_resolved_path(basic_config, tmp_path, monkeypatch):
+    """Test that Healer falls back to resolved paths when no name matches."""
+    from lazarus.config.schema import ScriptConfig
+
+    script = tmp_path / "job.py"
+    script.write_text("print('hi')\n")
+    link = tmp_path / "nightly.py"
+    link.symlink_to(script)
+    basic_config.scripts.append(ScriptConfig(name="job", path=script))
+    monkeypatch.chdir(tmp_path)
+
+    healer = Healer(basic_config)
+
+    assert healer._find_script_config(link) is basic_config.scripts[-1]
@@ -273,6 +273,49 @@ class TestHealingHistory:
         for record in records:
             assert "backup" in record.script_path
 
+    def test_get_history_with_limit_keeps_newest(self, tmp_path):
+        """Test that a limited history still returns the newest records."""
+        history_dir = tmp_path / "history"
+        history = HealingHistory(history_dir=history_dir)
+
+        now = datetime.now(UTC)
+        for i in range(5):
+            record_data = {
+                "id": f"record-{i}",
+                "timestamp": (now - timedelta(hours=i)).isoformat(),
+                "script_path": f"/test/script{i}.py",
+                "success": True,
+                "attempts_count": 1,
+                "duration": 10.0,
+            }
+            (history_dir / f"record-{i}.json").write_text(json.dumps(record_data))
+
+        records = history.get_history(limit=2)
+
+        assert [r.id for r in records] == ["record-0", "record-1"]
+
+    def test_iter_history_is_lazy_and_skips_invalid(self, tmp_path):
+        """Test iterating history parses files on demand and skips bad ones."""
+        history_dir = tmp_path / "history"
+        history = HealingHistory(history_dir=history_dir)
+
+        (history_dir / "broken.json").write_text("{not json")
+        record_data = {
+            "id": "valid",
+            "timestamp": datetime.now(UTC).isoformat(),
+            "script_path": "/test/backup.py",
+            "success": True,
+            "attempts_count": 1,
+            "duration": 10.0,
+        }
+        (history_dir / "valid.json").write_text(json.dumps(record_data))
+
+        records = history.iter_history(script_filter="BACKUP")
+
+        assert not isinstance(records, list)
+        assert [r.id for r in records] == ["valid"]
+        assert list(history.iter_history(script_filter="deploy")) == []
+
     def test_get_record(self, tmp_path):
         """Test getting a specific record by ID."""
         history_dir = tmp_path / "history"